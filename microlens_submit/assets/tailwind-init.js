@@ -0,0 +1,18 @@
+// Tailwind Play CDN theme shared by the dossier event, solution and full-report
+// pages. Loaded right after https://cdn.tailwindcss.com.
+tailwind.config = {
+  theme: {
+    extend: {
+      colors: {
+        'rtd-primary': '#dfc5fa',
+        'rtd-secondary': '#361d49',
+        'rtd-accent': '#a859e4',
+        'rtd-background': '#faf7fd',
+        'rtd-text': '#000',
+      },
+      fontFamily: {
+        inter: ['Inter', 'sans-serif'],
+      },
+    },
+  },
+};
@@ -4,16 +4,14 @@ from pathlib import Path
 from typing import Optional
 
 import typer
-from rich.console import Console
 from rich.panel import Panel
 
+from microlens_submit.cli.console import console
 from microlens_submit.dossier import generate_dashboard_html, generate_event_page, generate_solution_page
 from microlens_submit.dossier.full_report import generate_full_dossier_report_html
-from microlens_submit.dossier.utils import copy_dossier_assets
+from microlens_submit.dossier.utils import copy_dossier_assets, gzip_file, utc_timestamp
 from microlens_submit.utils import load
 
-console = Console()
-
 
 def generate_dossier(
     project_path: Path = typer.Argument(Path("."), help="Project directory"),
@@ -32,6 +30,23 @@ def generate_dossier(
         "--open",
         help="Open the generated dossier in your web browser after generation.",
     ),
+    workers: int = typer.Option(
+        1,
+        "--workers",
+        "-j",
+        min=1,
+        help="Number of processes used to write event and solution pages for a full dossier.",
+    ),
+    incremental: bool = typer.Option(
+        False,
+        "--incremental",
+        help="Only rewrite event and solution pages of a full dossier whose content changed.",
+    ),
+    compress: bool = typer.Option(
+        False,
+        "--compress",
+        help="Also write a gzip-compressed index.html.gz for a full dossier.",
+    ),
 ) -> None:
     """Generate an HTML dossier for the submission.
 
@@ -54,11 +69,7 @@ def generate_dossier(
             console.print(f"Solution {solution_id} not found", style="bold red")
             raise typer.Exit(1)
 
-        # Create output directory and assets subdirectory
-        output_dir.mkdir(parents=True, exist_ok=True)
-        (output_dir / "assets").mkdir(exist_ok=True)
-
-        # Copy shared assets for the dossier
+        # Create the output directory and copy shared assets for the dossier
         copy_dossier_assets(output_dir)
 
         # Generate only the specific solution page
@@ -83,10 +94,7 @@ def generate_dossier(
             console.print(f"Event {event_id} not found", style="bold red")
             raise typer.Exit(1)
 
-        # Create output directory and assets subdirectory
-        output_dir.mkdir(parents=True, exist_ok=True)
-        (output_dir / "assets").mkdir(exist_ok=True)
-
+        # Create the output directory and copy shared assets for the dossier
         event = sub.events[event_id]
         copy_dossier_assets(output_dir)
         console.print(Panel(f"Generating dossier for event {event_id}...", style="cyan"))
@@ -106,17 +114,18 @@ def generate_dossier(
                 style="cyan",
             )
         )
-        generate_dashboard_html(sub, output_dir)
+        # The dashboard, pages and printable report share one timestamp
+        generated_at = utc_timestamp()
+        generate_dashboard_html(sub, output_dir, workers=workers, incremental=incremental, generated_at=generated_at)
 
         # Generate comprehensive printable dossier
         console.print(Panel("Generating comprehensive printable dossier...", style="cyan"))
-        generate_full_dossier_report_html(sub, output_dir)
+        generate_full_dossier_report_html(sub, output_dir, generated_at=generated_at)
 
         # Replace placeholder in index.html with the real link
         dashboard_path = output_dir / "index.html"
         if dashboard_path.exists():
-            with dashboard_path.open("r", encoding="utf-8") as f:
-                dashboard_html = f.read()
+            dashboard_html = dashboard_path.read_text(encoding="utf-8")
             dashboard_html = dashboard_html.replace(
                 "<!--FULL_DOSSIER_LINK_PLACEHOLDER-->",
                 '<div class="text-center">'
@@ -126,8 +135,10 @@ def generate_dossier(
                 'transition-colors duration-200 text-lg font-semibold mt-8">'
                 "View Full Comprehensive Dossier (Printable)</a></div>",
             )
-            with dashboard_path.open("w", encoding="utf-8") as f:
-                f.write(dashboard_html)
+            dashboard_path.write_bytes(dashboard_html.encode("utf-8"))
+            # Compress only now, so the .gz includes the full-dossier link
+            if compress:
+                gzip_file(dashboard_path)
         console.print(Panel("Comprehensive dossier generated!", style="bold green"))
 
         # Open the main dashboard if requested
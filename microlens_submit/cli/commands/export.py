@@ -4,14 +4,12 @@ from pathlib import Path
 from typing import Optional
 
 import typer
-from rich.console import Console
 from rich.panel import Panel
 
+from microlens_submit.cli.console import console
 from microlens_submit.text_symbols import symbol
 from microlens_submit.utils import load
 
-console = Console()
-
 
 def export(
     output_path: Path,
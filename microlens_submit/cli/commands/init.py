@@ -1,16 +1,40 @@
 """Initialization commands for microlens-submit CLI."""
 
+import functools
+import os
 import subprocess
 from pathlib import Path
+from typing import Optional
 
 import typer
-from rich.console import Console
 from rich.panel import Panel
 
+from microlens_submit.cli.console import console
+from microlens_submit.models import Submission
 from microlens_submit.text_symbols import symbol
 from microlens_submit.utils import load
 
-console = Console()
+
+@functools.lru_cache(maxsize=8)
+def _detect_repo_url(cwd: str) -> Optional[str]:
+    """Return ``remote.origin.url`` for the git checkout containing ``cwd``.
+
+    The lookup forks a ``git`` process, so results are cached per working
+    directory for the lifetime of the process.
+    """
+    try:
+        repo_url = (
+            subprocess.check_output(
+                ["git", "config", "--get", "remote.origin.url"],
+                cwd=cwd,
+                stderr=subprocess.DEVNULL,
+            )
+            .decode()
+            .strip()
+        )
+    except Exception:
+        return None
+    return repo_url or None
 
 
 def init(
@@ -55,6 +79,11 @@ def init(
         set. Otherwise, a warning is shown and you can set it later with
         set-repo-url command.
     """
+    _init_project(team_name, tier, project_path, show_warnings=show_warnings)
+
+
+def _init_project(team_name: str, tier: str, project_path: Path, show_warnings: bool = True) -> Submission:
+    """Initialize and save the project for :func:`init`, returning the submission."""
     # Validate tier
     try:
         from microlens_submit.tier_validation import get_available_tiers, get_tier_description
@@ -79,17 +108,7 @@ def init(
     sub.team_name = team_name
     sub.tier = tier
     # Try to auto-detect repo_url
-    try:
-        repo_url = (
-            subprocess.check_output(
-                ["git", "config", "--get", "remote.origin.url"],
-                stderr=subprocess.DEVNULL,
-            )
-            .decode()
-            .strip()
-        )
-    except Exception:
-        repo_url = None
+    repo_url = _detect_repo_url(os.getcwd())
     if repo_url:
         sub.repo_url = repo_url
         console.print(f"[green]Auto-detected GitHub repo URL:[/green] {repo_url}")
@@ -122,6 +141,7 @@ def init(
         console.print(f"[yellow]{str(e)}[/yellow]")
         console.print(f"[yellow]{symbol('hint')} Fix validation errors before saving or exporting.[/yellow]")
         console.print(Panel(f"Initialized project at {project_path} (unsaved)", style="bold yellow"))
+    return sub
 
 
 def nexus_init(
@@ -156,8 +176,7 @@ def nexus_init(
         environment. It will silently skip any environment information that
         cannot be detected (e.g., if running outside of Nexus).
     """
-    init(team_name=team_name, tier=tier, project_path=project_path, show_warnings=False)
-    sub = load(str(project_path))
+    sub = _init_project(team_name, tier, project_path, show_warnings=False)
     sub.autofill_nexus_info()
 
     # Run warnings-only validation after adding hardware info
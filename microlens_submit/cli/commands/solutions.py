@@ -11,32 +11,39 @@ from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
 
 import typer
-from rich.console import Console
 from rich.panel import Panel
 
+from microlens_submit.cli.console import console
 from microlens_submit.error_messages import enhance_validation_messages, format_cli_error_with_suggestions
+from microlens_submit.json_utils import read_json
 from microlens_submit.text_symbols import symbol
 from microlens_submit.utils import import_solutions_from_csv, load
 
-console = Console()
-
 
 _NUMERIC_RE = re.compile(r"^[+-]?((\\d+(\\.\\d*)?)|(\\.\\d+))([eE][+-]?\\d+)?$")
 
 
+# First characters a JSON document can start with (including NaN/Infinity,
+# which json.loads accepts). Anything else is a plain string and skips the
+# raise/catch of a failed json.loads.
+_JSON_START_CHARS = frozenset('{["-0123456789tfnNI')
+
+
 def _parse_cli_value(value: str) -> Any:
     """Parse a CLI value using JSON, with a numeric fallback for .001-style input."""
-    try:
-        return json.loads(value)
-    except json.JSONDecodeError:
-        if _NUMERIC_RE.match(value.strip()):
-            try:
-                if re.match(r"^[+-]?\\d+$", value.strip()):
-                    return int(value)
-                return float(value)
-            except ValueError:
-                pass
-        return value
+    if value.lstrip()[:1] in _JSON_START_CHARS:
+        try:
+            return json.loads(value)
+        except json.JSONDecodeError:
+            pass
+    if _NUMERIC_RE.match(value.strip()):
+        try:
+            if re.match(r"^[+-]?\\d+$", value.strip()):
+                return int(value)
+            return float(value)
+        except ValueError:
+            pass
+    return value
 
 
 def _run_editor(editor_cmd: str, notes_file: Path) -> bool:
@@ -66,6 +73,17 @@ def _parse_pairs(pairs: Optional[List[str]]) -> Optional[Dict]:
     return out
 
 
+def _diff_pairs(current: Dict, pairs: List[str], kind: str) -> Dict:
+    """Parse CLI key=value options and keep only the entries that differ from ``current``."""
+    updates: Dict = {}
+    for item in pairs:
+        if "=" not in item:
+            raise typer.BadParameter(f"Invalid {kind} format: {item}")
+        key, value = item.split("=", 1)
+        updates[key] = _parse_cli_value(value)
+    return {key: value for key, value in updates.items() if current.get(key) != value}
+
+
 def _params_file_callback(ctx: typer.Context, value: Optional[Path]) -> Optional[Path]:
     """Validate mutually exclusive parameter options."""
     param_vals = ctx.params.get("param")
@@ -82,11 +100,11 @@ def _parse_structured_params_file(params_file: Path) -> Tuple[Dict, Dict]:
     """
     import yaml
 
-    with params_file.open("r", encoding="utf-8") as fh:
-        if params_file.suffix.lower() in [".yaml", ".yml"]:
+    if params_file.suffix.lower() in [".yaml", ".yml"]:
+        with params_file.open("r", encoding="utf-8") as fh:
             data = yaml.safe_load(fh)
-        else:
-            data = json.load(fh)
+    else:
+        data = read_json(params_file)
 
     # Handle structured format
     if isinstance(data, dict) and ("parameters" in data or "uncertainties" in data):
@@ -307,9 +325,13 @@ def add_solution(
     sol.used_astrometry = used_astrometry
     sol.used_postage_stamps = used_postage_stamps
     sol.limb_darkening_model = limb_darkening_model
-    sol.limb_darkening_coeffs = _parse_pairs(limb_darkening_coeff)
-    sol.parameter_uncertainties = _parse_pairs(parameter_uncertainty) or uncertainties
-    sol.physical_parameters = _parse_pairs(physical_param)
+    # Parse the key=value options once; the dry-run summary reuses them.
+    ld_coeffs = _parse_pairs(limb_darkening_coeff)
+    param_uncertainties = _parse_pairs(parameter_uncertainty)
+    physical_params = _parse_pairs(physical_param)
+    sol.limb_darkening_coeffs = ld_coeffs
+    sol.parameter_uncertainties = param_uncertainties or uncertainties
+    sol.physical_parameters = physical_params
     sol.physical_parameter_uncertainties = _parse_pairs(physical_param_uncertainty)
     sol.uncertainty_method = uncertainty_method
     if confidence_level is not None:
@@ -339,9 +361,9 @@ def add_solution(
             "used_astrometry": used_astrometry,
             "used_postage_stamps": used_postage_stamps,
             "limb_darkening_model": limb_darkening_model,
-            "limb_darkening_coeffs": _parse_pairs(limb_darkening_coeff),
-            "parameter_uncertainties": _parse_pairs(parameter_uncertainty),
-            "physical_parameters": _parse_pairs(physical_param),
+            "limb_darkening_coeffs": ld_coeffs,
+            "parameter_uncertainties": param_uncertainties,
+            "physical_parameters": physical_params,
             "log_likelihood": log_likelihood,
             "relative_probability": relative_probability,
             "n_data_points": n_data_points,
@@ -601,6 +623,7 @@ def edit_solution(
         raise typer.Exit(code=1)
     arrow = symbol("arrow")
     changes = []
+    notes_to_clear: Optional[Path] = None
     if alias is not None:
         if target_solution.alias != alias:
             changes.append(f"Update alias: {target_solution.alias} {arrow} {alias}")
@@ -653,8 +676,13 @@ def edit_solution(
     elif clear_notes:
         if target_solution.notes_path:
             notes_file_path = Path(project_path) / target_solution.notes_path
-            notes_file_path.parent.mkdir(parents=True, exist_ok=True)
-            notes_file_path.write_text("", encoding="utf-8")
+            try:
+                already_empty = notes_file_path.stat().st_size == 0
+            except FileNotFoundError:
+                already_empty = False
+            if not already_empty:
+                # Truncated together with the save below, never on --dry-run
+                notes_to_clear = notes_file_path
             changes.append(f"Cleared notes in {notes_file_path}")
     if clear_parameter_uncertainties:
         if target_solution.parameter_uncertainties:
@@ -693,27 +721,19 @@ def edit_solution(
             git_dir=sub.git_dir,
         )
     if param:
-        for p in param:
-            if "=" not in p:
-                raise typer.BadParameter(f"Invalid parameter format: {p}")
-            key, value = p.split("=", 1)
-            new_value = _parse_cli_value(value)
-            old_value = target_solution.parameters.get(key)
-            if old_value != new_value:
-                changes.append(f"Update parameter {key}: {old_value} {arrow} {new_value}")
-                target_solution.parameters[key] = new_value
+        current = target_solution.parameters
+        diff = _diff_pairs(current, param, "parameter")
+        for key, new_value in diff.items():
+            changes.append(f"Update parameter {key}: {current.get(key)} {arrow} {new_value}")
+        current.update(diff)
     if param_uncertainty:
         if target_solution.parameter_uncertainties is None:
             target_solution.parameter_uncertainties = {}
-        for p in param_uncertainty:
-            if "=" not in p:
-                raise typer.BadParameter(f"Invalid uncertainty format: {p}")
-            key, value = p.split("=", 1)
-            new_value = _parse_cli_value(value)
-            old_value = target_solution.parameter_uncertainties.get(key)
-            if old_value != new_value:
-                changes.append(f"Update uncertainty {key}: {old_value} {arrow} {new_value}")
-                target_solution.parameter_uncertainties[key] = new_value
+        current = target_solution.parameter_uncertainties
+        diff = _diff_pairs(current, param_uncertainty, "uncertainty")
+        for key, new_value in diff.items():
+            changes.append(f"Update uncertainty {key}: {current.get(key)} {arrow} {new_value}")
+        current.update(diff)
     if clear_higher_order_effects:
         if target_solution.higher_order_effects:
             changes.append(f"Clear higher_order_effects: {target_solution.higher_order_effects}")
@@ -766,6 +786,9 @@ def edit_solution(
         else:
             console.print(Panel("No changes would be made", style="yellow"))
         return
+    if notes_to_clear is not None:
+        notes_to_clear.parent.mkdir(parents=True, exist_ok=True)
+        notes_to_clear.write_text("", encoding="utf-8")
     if changes:
         sub.save()
         console.print(Panel(f"Updated {solution_id} (event {target_event_id})", style="green"))
@@ -791,8 +814,11 @@ def edit_notes(
                 )
                 raise typer.Exit(code=1)
             notes_file = Path(project_path) / sol.notes_path
-            notes_file.parent.mkdir(parents=True, exist_ok=True)
-            if not notes_file.exists():
+            # Common case: the notes file already exists, so a single stat suffices
+            try:
+                notes_file.stat()
+            except FileNotFoundError:
+                notes_file.parent.mkdir(parents=True, exist_ok=True)
                 notes_file.write_text("", encoding="utf-8")
             editor = os.environ.get("EDITOR") or os.environ.get("VISUAL")
             if editor and _run_editor(editor, notes_file):
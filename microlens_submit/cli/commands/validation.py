@@ -1,21 +1,21 @@
 """Validation commands for microlens-submit CLI."""
 
+import heapq
 import math
+from operator import itemgetter
 from pathlib import Path
-from typing import Dict
+from typing import Dict, Optional
 
 import typer
-from rich.console import Console
 from rich.panel import Panel
 from rich.table import Table
 
+from microlens_submit.cli.console import console
 from microlens_submit.error_messages import enhance_validation_messages
 from microlens_submit.text_symbols import symbol
 from microlens_submit.utils import load
 from microlens_submit.validate_parameters import count_model_parameters
 
-console = Console()
-
 
 def validate_solution(
     solution_id: str,
@@ -141,12 +141,23 @@ def list_solutions(
     event_id: str,
     project_path: Path = typer.Argument(Path("."), help="Project directory"),
 ) -> None:
-    """Display a table of solutions for a specific event."""
+    """Display a table of solutions for a specific event.
+
+    When stdout is not a terminal (e.g. piped to ``grep``), one tab-separated
+    line per solution is printed instead of a Rich table.
+    """
     sub = load(str(project_path))
     if event_id not in sub.events:
         console.print(f"Event {event_id} not found", style="bold red")
         raise typer.Exit(code=1)
     evt = sub.events[event_id]
+    if not console.is_terminal:
+        for sol in evt.solutions.values():
+            status = "Active" if sol.is_active else "Inactive"
+            notes = " ".join(sol.notes.split())
+            typer.echo(f"{sol.solution_id}\t{sol.model_type}\t{status}\t{notes}")
+        return
+
     table = Table(title=f"Solutions for {event_id}")
     table.add_column("Solution ID")
     table.add_column("Model Type")
@@ -160,6 +171,12 @@ def list_solutions(
 
 def compare_solutions(
     event_id: str,
+    top: Optional[int] = typer.Option(
+        None,
+        "--top",
+        min=1,
+        help="Only show the N solutions with the lowest BIC",
+    ),
     project_path: Path = typer.Argument(Path("."), help="Project directory"),
 ) -> None:
     """Rank active solutions for an event using the Bayesian Information Criterion."""
@@ -169,7 +186,10 @@ def compare_solutions(
         raise typer.Exit(code=1)
 
     evt = sub.events[event_id]
+    # Filter and compute k and BIC in one pass; reused for the weights and the rows.
     solutions = []
+    k_map: Dict[str, int] = {}
+    bic_map: Dict[str, float] = {}
     for s in evt.get_active_solutions():
         if s.log_likelihood is None or s.n_data_points is None:
             continue
@@ -180,6 +200,16 @@ def compare_solutions(
             )
             continue
         solutions.append(s)
+        k = count_model_parameters(s.parameters)
+        k_map[s.solution_id] = k
+        bic_map[s.solution_id] = k * math.log(s.n_data_points) - 2 * s.log_likelihood
+
+    if not solutions:
+        console.print(
+            f"No active solutions with log_likelihood and n_data_points to compare for {event_id}",
+            style="yellow",
+        )
+        return
 
     table = Table(title=f"Solution Comparison for {event_id}")
     table.add_column("Solution ID")
@@ -192,57 +222,48 @@ def compare_solutions(
 
     rel_prob_map: Dict[str, float] = {}
     note = None
-    if solutions:
-        provided_sum = sum(s.relative_probability or 0.0 for s in solutions if s.relative_probability is not None)
-        need_calc = [s for s in solutions if s.relative_probability is None]
-        if need_calc:
-            can_calc = all(
-                s.log_likelihood is not None
-                and s.n_data_points
-                and s.n_data_points > 0
-                and count_model_parameters(s.parameters) > 0
-                for s in need_calc
-            )
-            remaining = max(1.0 - provided_sum, 0.0)
-            if can_calc:
-                bic_vals = {
-                    s.solution_id: count_model_parameters(s.parameters) * math.log(s.n_data_points)
-                    - 2 * s.log_likelihood
-                    for s in need_calc
-                }
-                bic_min = min(bic_vals.values())
-                weights = {sid: math.exp(-0.5 * (bic - bic_min)) for sid, bic in bic_vals.items()}
-                wsum = sum(weights.values())
-                for sid, w in weights.items():
-                    rel_prob_map[sid] = remaining * w / wsum if wsum > 0 else remaining / len(weights)
-                note = "Relative probabilities calculated using BIC"
-            else:
-                eq = remaining / len(need_calc) if need_calc else 0.0
-                for s in need_calc:
-                    rel_prob_map[s.solution_id] = eq
-                note = "Relative probabilities set equal due to missing data"
+    provided_sum = sum(s.relative_probability or 0.0 for s in solutions if s.relative_probability is not None)
+    need_calc = [s for s in solutions if s.relative_probability is None]
+    if need_calc:
+        can_calc = all(k_map[s.solution_id] > 0 for s in need_calc)
+        remaining = max(1.0 - provided_sum, 0.0)
+        if can_calc:
+            bic_min = min(bic_map[s.solution_id] for s in need_calc)
+            weights = {s.solution_id: math.exp(-0.5 * (bic_map[s.solution_id] - bic_min)) for s in need_calc}
+            wsum = sum(weights.values())
+            for sid, w in weights.items():
+                rel_prob_map[sid] = remaining * w / wsum if wsum > 0 else remaining / len(weights)
+            note = "Relative probabilities calculated using BIC"
+        else:
+            eq = remaining / len(need_calc) if need_calc else 0.0
+            for s in need_calc:
+                rel_prob_map[s.solution_id] = eq
+            note = "Relative probabilities set equal due to missing data"
 
     rows = []
     for sol in solutions:
-        k = count_model_parameters(sol.parameters)
-        bic = k * math.log(sol.n_data_points) - 2 * sol.log_likelihood
-        rp = sol.relative_probability if sol.relative_probability is not None else rel_prob_map.get(sol.solution_id)
+        sid = sol.solution_id
+        bic = bic_map[sid]
+        rp = sol.relative_probability if sol.relative_probability is not None else rel_prob_map.get(sid)
+        effects = sol.higher_order_effects
         rows.append(
             (
                 bic,
-                [
-                    sol.solution_id,
+                (
+                    sid,
                     sol.model_type,
-                    (",".join(sol.higher_order_effects) if sol.higher_order_effects else "-"),
-                    str(k),
+                    ",".join(effects) if effects else "-",
+                    f"{k_map[sid]}",
                     f"{sol.log_likelihood:.2f}",
                     f"{bic:.2f}",
-                    f"{rp:.3f}" if rp is not None else "N/A",
-                ],
+                    "N/A" if rp is None else f"{rp:.3f}",
+                ),
             )
         )
 
-    for _, cols in sorted(rows, key=lambda x: x[0]):
+    by_bic = itemgetter(0)
+    ranked = heapq.nsmallest(top, rows, key=by_bic) if top else sorted(rows, key=by_bic)
+    for _, cols in ranked:
         table.add_row(*cols)
 
     console.print(table)
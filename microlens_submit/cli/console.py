@@ -0,0 +1,9 @@
+"""Shared Rich console for the microlens-submit CLI.
+
+Every command module prints through this one console, so global options such
+as ``--no-color`` apply to the output of all commands.
+"""
+
+from rich.console import Console
+
+console = Console()
@@ -39,14 +39,13 @@ and scripted usage patterns.
 from __future__ import annotations
 
 import typer
-from rich.console import Console
 
 from .. import __version__
 
 # Import command modules
 from .commands import dossier, export, init, solutions, validation
+from .console import console
 
-console = Console()
 app = typer.Typer()
 
 
@@ -90,8 +89,11 @@ def main(
         It's used to configure global settings like color output.
     """
     if no_color:
-        global console
-        console = Console(color_system=None)
+        # Only for this invocation: the console is shared by every command
+        # run in this process (tests, notebooks), so restore it afterwards.
+        previous = console.no_color
+        console.no_color = True
+        ctx.call_on_close(lambda: setattr(console, "no_color", previous))
 
 
 # Register all commands from modules
@@ -7,224 +7,49 @@ of the submission including event summaries, solution statistics, and metadata.
 """
 
 import webbrowser
-from datetime import datetime
+from concurrent.futures import ProcessPoolExecutor
+from html import escape
+from itertools import repeat
 from pathlib import Path
+from typing import Iterator, Optional
 
 from .. import __version__
 from ..models.submission import Submission
-from .utils import copy_dossier_assets, extract_github_repo_name, format_hardware_info
-
-
-def generate_dashboard_html(submission: Submission, output_dir: Path, open: bool = False) -> None:
-    """Generate a complete HTML dossier for the submission.
-
-    Creates a comprehensive HTML dashboard that provides an overview of the submission,
-    including event summaries, solution statistics, and metadata. The dossier includes:
-    - Main dashboard (index.html) with submission overview
-    - Individual event pages for each event
-    - Individual solution pages for each solution
-    - Full comprehensive dossier (full_dossier_report.html) for printing
-
-    The function creates the output directory structure and copies necessary assets
-    like logos and GitHub icons.
-
-    Args:
-        submission: The submission object containing events and solutions.
-        output_dir: Directory where the HTML files will be saved. Will be created
-            if it doesn't exist.
-        open: If True, open the generated index.html in the default web browser after generation.
-
-    Raises:
-        OSError: If unable to create output directory or write files.
-        ValueError: If submission data is invalid or missing required fields.
-
-    Example:
-        >>> from microlens_submit import load
-        >>> from microlens_submit.dossier import generate_dashboard_html
-        >>> from pathlib import Path
-        >>>
-        >>> # Load a submission project
-        >>> submission = load("./my_project")
-        >>>
-        >>> # Generate the complete dossier and open in browser
-        >>> generate_dashboard_html(submission, Path("./dossier_output"), open=True)
-        >>>
-        >>> # Files created:
-        >>> # - ./dossier_output/index.html (main dashboard)
-        >>> # - ./dossier_output/EVENT001.html (event page)
-        >>> # - ./dossier_output/solution_id.html (solution pages)
-        >>> # - ./dossier_output/full_dossier_report.html (printable version)
-        >>> # - ./dossier_output/assets/ (logos and icons)
-
-    Note:
-        This function generates all dossier components. For partial generation
-        (e.g., only specific events), use the CLI command with --event-id or
-        --solution-id flags instead.
-    """
-    # Create output directory structure
-    output_dir.mkdir(parents=True, exist_ok=True)
-    (output_dir / "assets").mkdir(exist_ok=True)
-    # (No events or solutions subfolders)
-
-    # Check if full dossier report exists
-    full_dossier_exists = (output_dir / "full_dossier_report.html").exists()
-    # Generate the main dashboard HTML
-    html_content = _generate_dashboard_content(submission, full_dossier_exists=full_dossier_exists)
-
-    # Write the HTML file
-    index_path = output_dir / "index.html"
-    with index_path.open("w", encoding="utf-8") as f:
-        f.write(html_content)
-
-    copy_dossier_assets(output_dir)
-
-    # After generating index.html, generate event pages
-    # Import here to avoid circular imports
-    from .event_page import generate_event_page
-
-    for event in submission.events.values():
-        generate_event_page(event, submission, output_dir)
-
-    # Optionally open the dashboard in the browser
-    if open:
-        webbrowser.open(index_path.resolve().as_uri())
-
-
-def _generate_dashboard_content(submission: Submission, full_dossier_exists: bool = False) -> str:
-    """Generate the HTML content for the submission dashboard.
-
-    Creates the main dashboard HTML following the Dashboard_Design.md specification.
-    The dashboard includes submission statistics, progress tracking, event tables,
-    and aggregate parameter distributions.
-
-    Args:
-        submission: The submission object containing events and solutions.
-        full_dossier_exists: Whether the full dossier report exists. Currently
-            ignored but kept for future use.
-
-    Returns:
-        str: Complete HTML content as a string, ready to be written to index.html.
-
-    Example:
-        >>> from microlens_submit import load
-        >>> from microlens_submit.dossier import _generate_dashboard_content
-        >>>
-        >>> submission = load("./my_project")
-        >>> html_content = _generate_dashboard_content(submission)
-        >>>
-        >>> # Write to file
-        >>> with open("dashboard.html", "w", encoding="utf-8") as f:
-        ...     f.write(html_content)
-
-    Note:
-        This is an internal function. Use generate_dashboard_html() for the
-        complete dossier generation workflow.
-    """
-    # Calculate statistics
-    total_events = len(submission.events)
-    total_active_solutions = sum(len(event.get_active_solutions()) for event in submission.events.values())
-    total_cpu_hours = 0
-    total_wall_time_hours = 0
-
-    # Calculate compute time
-    for event in submission.events.values():
-        for solution in event.solutions.values():
-            if solution.compute_info:
-                total_cpu_hours += solution.compute_info.get("cpu_hours", 0)
-                total_wall_time_hours += solution.compute_info.get("wall_time_hours", 0)
-
-    # Format hardware info
-    hardware_info_str = format_hardware_info(submission.hardware_info)
-
-    # Calculate progress (hardcoded total from design spec)
-    TOTAL_CHALLENGE_EVENTS = 293
-    progress_percentage = (total_events / TOTAL_CHALLENGE_EVENTS) * 100 if TOTAL_CHALLENGE_EVENTS > 0 else 0
-
-    # Generate event table
-    event_rows = []
-    for event in sorted(submission.events.values(), key=lambda e: e.event_id):
-        active_solutions = event.get_active_solutions()
-        model_types = set(sol.model_type for sol in active_solutions)
-        model_types_str = ", ".join(sorted(model_types)) if model_types else "None"
-
-        event_rows.append(
-            f"""
-            <tr class="border-b border-gray-200 hover:bg-gray-50">
-                <td class="py-3 px-4">
-                    <a href="{event.event_id}.html"
-                       class="font-medium text-rtd-accent hover:underline">
-                        {event.event_id}
-                    </a>
-                </td>
-                <td class="py-3 px-4">{len(active_solutions)}</td>
-                <td class="py-3 px-4">{model_types_str}</td>
-            </tr>
-        """
-        )
-
-    event_table = (
-        "\n".join(event_rows)
-        if event_rows
-        else """
+from .utils import (
+    BackgroundWriter,
+    copy_dossier_assets,
+    ensure_dir,
+    extract_github_repo_name,
+    format_hardware_info,
+    gzip_file,
+    utc_timestamp,
+)
+
+# Total number of challenge events (hardcoded from the design spec)
+TOTAL_CHALLENGE_EVENTS = 293
+
+_NO_EVENTS_ROW = """
         <tr class="border-b border-gray-200">
             <td colspan="3" class="py-3 px-4 text-center text-gray-500">
                 No events found
             </td>
         </tr>
     """
-    )
-
-    # Insert Print Full Dossier placeholder before the footer
-    print_link_html = "<!--FULL_DOSSIER_LINK_PLACEHOLDER-->"
-
-    # GitHub repo link (if present)
-    github_html = ""
-    repo_url = getattr(submission, "repo_url", None) or (
-        submission.repo_url if hasattr(submission, "repo_url") else None
-    )
-    if repo_url:
-        repo_name = extract_github_repo_name(repo_url)
-        github_html = f"""
-        <div class="flex items-center justify-center mb-4">
-            <a href="{repo_url}" target="_blank" rel="noopener"
-               class="flex items-center space-x-2 group">
-                <img src="assets/github-desktop_logo.png" alt="GitHub"
-                     class="w-6 h-6 inline-block align-middle mr-2 group-hover:opacity-80"
-                     style="display:inline;vertical-align:middle;">
-                <span class="text-base text-rtd-accent font-semibold group-hover:underline">
-                    {repo_name}
-                </span>
-            </a>
-        </div>
-        """
 
-    # Generate the complete HTML following the design spec
-    html = f"""<!DOCTYPE html>
+# Page skeleton for index.html, split so that only the small dynamic body
+# goes through str.format(); the team name is spliced into the <title>.
+# The FULL_DOSSIER_LINK_PLACEHOLDER comment is replaced by the CLI once the
+# printable report exists.
+_DASHBOARD_HEAD_OPEN = """<!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>Microlensing Data Challenge Submission Dossier - \
-{submission.team_name}</title>
-    <script src="https://cdn.tailwindcss.com"></script>
-    <script>
-      tailwind.config = {{
-        theme: {{
-          extend: {{
-            colors: {{
-              'rtd-primary': '#dfc5fa',
-              'rtd-secondary': '#361d49',
-              'rtd-accent': '#a859e4',
-              'rtd-background': '#faf7fd',
-              'rtd-text': '#000',
-            }},
-            fontFamily: {{
-              inter: ['Inter', 'sans-serif'],
-            }},
-          }},
-        }},
-      }};
-    </script>
+    <title>Microlensing Data Challenge Submission Dossier - """
+
+# Static part of <head> (prebuilt Tailwind CSS, fonts, prose styles); no placeholders.
+_DASHBOARD_HEAD = """</title>
+    <link rel="stylesheet" href="./assets/tailwind.css">
     <link
         href="https://fonts.googleapis.com/css2?family=Inter:wght@400;600;700&display=swap"
         rel="stylesheet"
@@ -240,72 +65,76 @@ def _generate_dashboard_content(submission: Submission, full_dossier_exists: boo
     </script>
     <script>hljs.highlightAll();</script>
     <style>
-        .prose {{
+        .prose {
             color: #000;
             line-height: 1.6;
-        }}
-        .prose h1 {{
+        }
+        .prose h1 {
             font-size: 1.5rem;
             font-weight: 700;
             color: #361d49;
             margin-top: 1.5rem;
             margin-bottom: 0.75rem;
-        }}
-        .prose h2 {{
+        }
+        .prose h2 {
             font-size: 1.25rem;
             font-weight: 600;
             color: #361d49;
             margin-top: 1.25rem;
             margin-bottom: 0.5rem;
-        }}
-        .prose h3 {{
+        }
+        .prose h3 {
             font-size: 1.125rem;
             font-weight: 600;
             color: #a859e4;
             margin-top: 1rem;
             margin-bottom: 0.5rem;
-        }}
-        .prose p {{
+        }
+        .prose p {
             margin-bottom: 0.75rem;
-        }}
-        .prose ul, .prose ol {{
+        }
+        .prose ul, .prose ol {
             margin-left: 1.5rem;
             margin-bottom: 0.75rem;
-        }}
-        .prose ul {{ list-style-type: disc; }}
-        .prose ol {{ list-style-type: decimal; }}
-        .prose li {{
+        }
+        .prose ul { list-style-type: disc; }
+        .prose ol { list-style-type: decimal; }
+        .prose li {
             margin-bottom: 0.25rem;
-        }}
-        .prose code {{
+        }
+        .prose code {
             background: #f3f3f3;
             padding: 2px 4px;
             border-radius: 4px;
             font-family: 'Courier New', monospace;
             font-size: 0.875rem;
-        }}
-        .prose pre {{
+        }
+        .prose pre {
             background: #f8f8f8;
             padding: 1rem;
             border-radius: 8px;
             overflow-x: auto;
             margin: 1rem 0;
             border: 1px solid #e5e5e5;
-        }}
-        .prose pre code {{
+        }
+        .prose pre code {
             background: none;
             padding: 0;
-        }}
-        .prose blockquote {{
+        }
+        .prose blockquote {
             border-left: 4px solid #a859e4;
             padding-left: 1rem;
             margin: 1rem 0;
             font-style: italic;
             color: #666;
-        }}
+        }
     </style>
 </head>
-<body class="font-inter bg-rtd-background">
+"""
+
+# Page body, filled in with str.format(). It is split around the event table
+# so the rows can be written between the two halves without joining them.
+_DASHBOARD_BODY_TEMPLATE = """<body class="font-inter bg-rtd-background">
     <div class="max-w-7xl mx-auto p-6 lg:p-8">
         <div class="bg-white shadow-xl rounded-lg">
             <!-- Header Section -->
@@ -316,8 +145,8 @@ class="w-48 mx-auto mb-6">
                     Microlensing Data Challenge Submission Dossier
                 </h1>
                 <p class="text-xl text-rtd-accent text-center mb-8">
-                    Team: {submission.team_name or 'Not specified'} |
-                    Tier: {submission.tier or 'Not specified'}
+                    Team: {team_display} |
+                    Tier: {tier_display}
                 </p>
                 {github_html}
             </div>
@@ -371,7 +200,7 @@ class="w-48 mx-auto mb-6">
 style="width: {progress_percentage}%"></div>
                 </div>
                 <p class="text-sm text-rtd-text text-center mb-6">
-                    {total_events} / {TOTAL_CHALLENGE_EVENTS} Events Processed
+                    {total_events} / {total_challenge_events} Events Processed
                     ({progress_percentage:.1f}%)
                 </p>
 
@@ -460,12 +289,12 @@ style="width: {progress_percentage}%"></div>
                     </div>
                 </div>
             </section>
-            {print_link_html}
+            <!--FULL_DOSSIER_LINK_PLACEHOLDER-->
 
             <!-- Footer -->
             <div class="text-sm text-gray-500 text-center pt-8 pb-6">
-                Generated by microlens-submit v{__version__} on
-                {datetime.now().strftime('%Y-%m-%d %H:%M:%S UTC')}
+                Generated by microlens-submit v{version} on
+                {generated_at}
             </div>
 
             <!-- Regex Finish -->
@@ -474,5 +303,259 @@ style="width: {progress_percentage}%"></div>
     </div>
 </body>
 </html>"""
+_DASHBOARD_BODY_TOP, _DASHBOARD_BODY_BOTTOM = _DASHBOARD_BODY_TEMPLATE.split("{event_table}")
+
+
+def generate_dashboard_html(
+    submission: Submission,
+    output_dir: Path,
+    open: bool = False,
+    compress: bool = False,
+    workers: int = 1,
+    incremental: bool = False,
+    generated_at: Optional[str] = None,
+) -> None:
+    """Generate a complete HTML dossier for the submission.
+
+    Creates a comprehensive HTML dashboard that provides an overview of the submission,
+    including event summaries, solution statistics, and metadata. The dossier includes:
+    - Main dashboard (index.html) with submission overview
+    - Individual event pages for each event
+    - Individual solution pages for each solution
+    - Full comprehensive dossier (full_dossier_report.html) for printing
+
+    The function creates the output directory structure and copies necessary assets
+    like logos and GitHub icons.
+
+    Args:
+        submission: The submission object containing events and solutions.
+        output_dir: Directory where the HTML files will be saved. Will be created
+            if it doesn't exist.
+        open: If True, open the generated index.html in the default web browser after generation.
+        compress: If True, also write a gzip-compressed ``index.html.gz`` for
+            serving the dashboard precompressed.
+        workers: Number of worker processes used to write the event and
+            solution pages. The default of 1 writes them in this process.
+        incremental: If True, event and solution pages whose content is
+            unchanged on disk are not rewritten. Those pages keep the footer
+            time of the run that last wrote them.
+        generated_at: Timestamp shown in the page footers; defaults to the
+            current UTC time, taken once for all pages.
+
+    Raises:
+        OSError: If unable to create output directory or write files.
+        ValueError: If submission data is invalid or missing required fields.
+
+    Example:
+        >>> from microlens_submit import load
+        >>> from microlens_submit.dossier import generate_dashboard_html
+        >>> from pathlib import Path
+        >>>
+        >>> # Load a submission project
+        >>> submission = load("./my_project")
+        >>>
+        >>> # Generate the complete dossier and open in browser
+        >>> generate_dashboard_html(submission, Path("./dossier_output"), open=True)
+        >>>
+        >>> # Files created:
+        >>> # - ./dossier_output/index.html (main dashboard)
+        >>> # - ./dossier_output/EVENT001.html (event page)
+        >>> # - ./dossier_output/solution_id.html (solution pages)
+        >>> # - ./dossier_output/full_dossier_report.html (printable version)
+        >>> # - ./dossier_output/assets/ (logos and icons)
+
+    Note:
+        This function generates all dossier components. For partial generation
+        (e.g., only specific events), use the CLI command with --event-id or
+        --solution-id flags instead.
+    """
+    # Create output directory structure; copy_dossier_assets() adds assets/
+    ensure_dir(output_dir)
+    # One timestamp for every page of this generation
+    generated_at = generated_at or utc_timestamp()
+    # (No events or solutions subfolders)
+
+    # Check if full dossier report exists
+    full_dossier_exists = (output_dir / "full_dossier_report.html").exists()
+    # Stream the main dashboard HTML to disk piece by piece
+    index_path = output_dir / "index.html"
+    with index_path.open("w", encoding="utf-8", newline="", buffering=1 << 16) as f:
+        f.writelines(
+            _iter_dashboard_chunks(submission, full_dossier_exists=full_dossier_exists, generated_at=generated_at)
+        )
+    if compress:
+        gzip_file(index_path)
+
+    copy_dossier_assets(output_dir)
+
+    # After generating index.html, generate event pages
+    # Import here to avoid circular imports
+    from .event_page import generate_event_page
+
+    events = list(submission.events.values())
+    if workers > 1 and len(events) > 1:
+        # Pages are independent files; chunking lets each pickled batch share
+        # a single copy of the submission
+        chunksize = max(1, len(events) // (workers * 4))
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            for _ in executor.map(
+                generate_event_page,
+                events,
+                repeat(submission),
+                repeat(output_dir),
+                repeat(incremental),
+                repeat(generated_at),
+                chunksize=chunksize,
+            ):
+                pass
+    else:
+        # Render in this process; page writes overlap with the next render
+        with BackgroundWriter() as writer:
+            for event in events:
+                generate_event_page(
+                    event, submission, output_dir, incremental=incremental, generated_at=generated_at, writer=writer
+                )
+
+    # Optionally open the dashboard in the browser
+    if open:
+        webbrowser.open(index_path.resolve().as_uri())
+
+
+def _generate_dashboard_content(
+    submission: Submission,
+    full_dossier_exists: bool = False,
+    generated_at: Optional[str] = None,
+) -> str:
+    """Generate the HTML content for the submission dashboard.
+
+    Creates the main dashboard HTML following the Dashboard_Design.md specification.
+    The dashboard includes submission statistics, progress tracking, event tables,
+    and aggregate parameter distributions.
+
+    Args:
+        submission: The submission object containing events and solutions.
+        full_dossier_exists: Whether the full dossier report exists. Currently
+            ignored but kept for future use.
+        generated_at: Footer timestamp; defaults to the current UTC time.
+
+    Returns:
+        str: Complete HTML content as a string, ready to be written to index.html.
+
+    Example:
+        >>> from microlens_submit import load
+        >>> from microlens_submit.dossier import _generate_dashboard_content
+        >>>
+        >>> submission = load("./my_project")
+        >>> html_content = _generate_dashboard_content(submission)
+        >>>
+        >>> # Write to file
+        >>> with open("dashboard.html", "w", encoding="utf-8") as f:
+        ...     f.write(html_content)
+
+    Note:
+        This is an internal function. Use generate_dashboard_html() for the
+        complete dossier generation workflow.
+    """
+    return "".join(
+        _iter_dashboard_chunks(submission, full_dossier_exists=full_dossier_exists, generated_at=generated_at)
+    )
+
+
+def _iter_dashboard_chunks(
+    submission: Submission,
+    full_dossier_exists: bool = False,
+    generated_at: Optional[str] = None,
+) -> Iterator[str]:
+    """Yield the dashboard HTML in order: head, body top, event rows, body bottom.
+
+    See :func:`_generate_dashboard_content` for the arguments.
+    """
+    # The summary cards above the event table need the totals, so they are
+    # computed first; the table rows are then built and yielded one at a
+    # time, keeping memory flat however many events there are. User-supplied
+    # strings (team, tier, event IDs, hardware info, repository) are
+    # HTML-escaped before interpolation.
+    total_events = len(submission.events)
+    total_active_solutions = 0
+    total_cpu_hours = 0
+    total_wall_time_hours = 0
+    for event in submission.events.values():
+        for solution in event.solutions.values():
+            if solution.is_active:
+                total_active_solutions += 1
+            compute_info = solution.compute_info
+            if compute_info:
+                total_cpu_hours += compute_info.get("cpu_hours", 0)
+                total_wall_time_hours += compute_info.get("wall_time_hours", 0)
 
-    return html
+    # Format hardware info
+    hardware_info_str = escape(format_hardware_info(submission.hardware_info))
+
+    # Calculate progress against the challenge total
+    progress_percentage = (total_events / TOTAL_CHALLENGE_EVENTS) * 100 if TOTAL_CHALLENGE_EVENTS > 0 else 0
+
+    # GitHub repo link (if present)
+    github_html = ""
+    repo_url = getattr(submission, "repo_url", None) or (
+        submission.repo_url if hasattr(submission, "repo_url") else None
+    )
+    if repo_url:
+        repo_name = escape(extract_github_repo_name(repo_url))
+        repo_url = escape(repo_url)
+        github_html = f"""
+        <div class="flex items-center justify-center mb-4">
+            <a href="{repo_url}" target="_blank" rel="noopener"
+               class="flex items-center space-x-2 group">
+                <img src="assets/github-desktop_logo.png" alt="GitHub"
+                     class="w-6 h-6 inline-block align-middle mr-2 group-hover:opacity-80"
+                     style="display:inline;vertical-align:middle;">
+                <span class="text-base text-rtd-accent font-semibold group-hover:underline">
+                    {repo_name}
+                </span>
+            </a>
+        </div>
+        """
+
+    yield _DASHBOARD_HEAD_OPEN
+    yield escape(str(submission.team_name))
+    yield _DASHBOARD_HEAD
+    yield _DASHBOARD_BODY_TOP.format(
+        team_display=escape(submission.team_name) if submission.team_name else "Not specified",
+        tier_display=escape(submission.tier) if submission.tier else "Not specified",
+        github_html=github_html,
+        total_events=total_events,
+        total_active_solutions=total_active_solutions,
+        hardware_info_str=hardware_info_str,
+        progress_percentage=progress_percentage,
+        total_challenge_events=TOTAL_CHALLENGE_EVENTS,
+        total_cpu_hours=total_cpu_hours,
+        total_wall_time_hours=total_wall_time_hours,
+    )
+    if not submission.events:
+        yield _NO_EVENTS_ROW
+    for event in submission.sorted_events:
+        active_count = 0
+        model_types = []
+        for solution in event.solutions.values():
+            if solution.is_active:
+                active_count += 1
+                if solution.model_type not in model_types:
+                    model_types.append(solution.model_type)
+        # A handful of model types at most: a list with membership checks,
+        # sorted in place, beats building a set and a sorted copy
+        model_types.sort()
+        model_types_str = escape(", ".join(model_types)) if model_types else "None"
+        event_id = escape(event.event_id)
+        yield f"""
+            <tr class="border-b border-gray-200 hover:bg-gray-50">
+                <td class="py-3 px-4">
+                    <a href="{event_id}.html"
+                       class="font-medium text-rtd-accent hover:underline">
+                        {event_id}
+                    </a>
+                </td>
+                <td class="py-3 px-4">{active_count}</td>
+                <td class="py-3 px-4">{model_types_str}</td>
+            </tr>
+        \n"""
+    yield _DASHBOARD_BODY_BOTTOM.format(version=__version__, generated_at=generated_at or utc_timestamp())
@@ -6,16 +6,145 @@ microlensing events, including event overview, solutions tables, and
 evaluator-only visualizations.
 """
 
-from datetime import datetime
+import math
+from html import escape
 from pathlib import Path
+from typing import Optional, Tuple
 
 from .. import __version__
-from ..models import Event, Submission
+from ..models import Event, Solution, Submission
 from .solution_page import generate_solution_page
-from .utils import resolve_dossier_asset_path
+from .templates import PAGE_HEAD, PAGE_HEAD_OPEN
+from .utils import BackgroundWriter, resolve_dossier_asset_path, utc_timestamp, write_page
 
+_NO_SOLUTIONS_ROW = """
+        <tr class='border-b border-gray-200'>
+            <td colspan='7' class='py-3 px-4 text-center text-gray-500'>
+                No solutions found
+            </td>
+        </tr>
+    """
 
-def generate_event_page(event: Event, submission: Submission, output_dir: Path) -> None:
+# Page body after </head>, filled in with str.format().
+_EVENT_BODY_TEMPLATE = """<body class='font-inter bg-rtd-background'>
+    <div class='max-w-7xl mx-auto p-6 lg:p-8'>
+        <div class='bg-white shadow-xl rounded-lg'>
+            <!-- Header & Navigation -->
+            <div class='text-center py-8'>
+                <img src='assets/rges-pit_logo.png' alt='RGES-PIT Logo' class='w-48 mx-auto mb-6'>
+                <h1 class='text-4xl font-bold text-rtd-secondary text-center mb-2'>
+                    Event Dossier: {event_id}
+                </h1>
+                <p class='text-xl text-rtd-accent text-center mb-4'>
+                    Team: {team_display} | Tier: {tier_display}
+                </p>
+                <nav class='flex justify-center space-x-4 mb-8'>
+                    <a href='index.html' class='text-rtd-accent hover:underline'>&larr; Back to Dashboard</a>
+                </nav>
+            </div>
+
+            <hr class="border-t-4 border-rtd-accent my-8 mx-8">
+
+            <!-- Regex Start -->
+
+            <!-- Event Summary -->
+            <section class='mb-10 px-8'>
+                <h2 class='text-2xl font-semibold text-rtd-secondary mb-4'>Event Overview</h2>
+                <p class='text-rtd-text'>
+                    This page provides details for microlensing event {event_id}.
+                </p>
+                {raw_data_html}
+            </section>
+            <!-- Solutions Table -->
+            <section class='mb-10 px-8'>
+                <h2 class='text-2xl font-semibold text-rtd-secondary mb-4'>
+                    Solutions for Event {event_id}
+                </h2>
+                <table class='w-full text-left table-auto border-collapse'>
+                    <thead class='bg-rtd-primary text-rtd-secondary uppercase text-sm'>
+                        <tr>
+                            <th class='py-3 px-4'>Solution ID</th>
+                            <th class='py-3 px-4'>Model Type</th>
+                            <th class='py-3 px-4'>Status</th>
+                            <th class='py-3 px-4'>Log-Likelihood</th>
+                            <th class='py-3 px-4'>N Data Points</th>
+                            <th class='py-3 px-4'>Relative Probability</th>
+                            <th class='py-3 px-4'>Notes Snippet</th>
+                        </tr>
+                    </thead>
+                    <tbody class='text-rtd-text'>
+                        {table_body}
+                    </tbody>
+                </table>
+            </section>
+            <!-- Event-Specific Data Visualizations (Evaluator-Only Placeholders) -->
+            <section class='mb-10 px-8'>
+                <h2 class='text-2xl font-semibold text-rtd-secondary mb-4'>
+                    Event Data Visualizations (Evaluator-Only)
+                </h2>
+                <p class='text-sm text-gray-500 italic mb-4'>
+                    Note: These advanced plots, including comparisons to simulation truths and
+                    other teams' results, are available in the Evaluator Dossier.
+                </p>
+                <div class='mb-6'>
+                    <img
+                        src='https://placehold.co/800x450/dfc5fa/361d49?text=Raw+Lightcurve+and+Astrometry+Data+
+                        (Evaluator+Only)'
+                        alt='Raw Data Plot'
+                        class='w-full rounded-lg shadow-md'
+                    >
+                    <p class='text-sm text-gray-600 mt-2'>
+                        Raw lightcurve and astrometry data for Event
+                        {event_id}, with true model overlaid (Evaluator View).
+                    </p>
+                </div>
+                <div class='mb-6'>
+                    <img src='https://placehold.co/600x400/dfc5fa/361d49?text=Mass+vs+Distance+Scatter+Plot+
+(Evaluator+Only)'
+alt='Mass vs Distance Plot' class='w-full rounded-lg shadow-md'>
+                    <p class='text-sm text-gray-600 mt-2'>Derived Lens Mass vs. Lens Distance for solutions of \
+Event {event_id}. Points colored by Relative Probability (Evaluator View).</p>
+                </div>
+                <div class='mb-6'>
+                    <img src='https://placehold.co/600x400/dfc5fa/361d49?text=Proper+Motion+N+vs+E+Plot+
+(Evaluator+Only)'
+alt='Proper Motion Plot' class='w-full rounded-lg shadow-md'>
+                    <p class='text-sm text-gray-600 mt-2'>Proper Motion North vs. East components for solutions of \
+Event {event_id}. Points colored by Relative Probability (Evaluator View).</p>
+                </div>
+            </section>
+
+            <!-- Footer -->
+            <div class='text-sm text-gray-500 text-center pt-8 border-t border-gray-200 mt-10'>
+                Generated by microlens-submit v{version} on {generated_at}
+            </div>
+
+            <!-- Regex Finish -->
+
+        </div>
+    </div>
+</body>
+</html>"""
+
+
+def _solution_sort_key(sol: Solution) -> Tuple[bool, float, str]:
+    """Sort solutions active first, then by relative_probability (desc, None last), then by solution_id."""
+    relative_probability = sol.relative_probability
+    return (
+        not sol.is_active,  # active first
+        -relative_probability if relative_probability is not None else math.inf,
+        sol.solution_id,
+    )
+
+
+def generate_event_page(
+    event: Event,
+    submission: Submission,
+    output_dir: Path,
+    incremental: bool = False,
+    generated_at: Optional[str] = None,
+    writer: Optional[BackgroundWriter] = None,
+) -> None:
     """Generate an HTML dossier page for a single event.
 
     Creates a detailed HTML page for a specific microlensing event, following
@@ -27,6 +156,12 @@ def generate_event_page(event: Event, submission: Submission, output_dir: Path)
         submission: The parent Submission object for context and metadata.
         output_dir: The dossier directory where the HTML file will be saved.
             The file will be named {event.event_id}.html.
+        incremental: If True, pages whose content is unchanged on disk are
+            not rewritten (see :func:`write_page`).
+        generated_at: Footer timestamp for the event and solution pages;
+            defaults to the current UTC time.
+        writer: Optional :class:`BackgroundWriter` that performs the page
+            writes; by default each page is written before moving on.
 
     Raises:
         OSError: If unable to write the HTML file.
@@ -61,13 +196,16 @@ def generate_event_page(event: Event, submission: Submission, output_dir: Path)
             subdir="event-data",
             prefix=f"{event.event_id}_event_data",
         )
-    html = _generate_event_page_content(event, submission, event_data_link=event_data_link)
-    with (output_dir / f"{event.event_id}.html").open("w", encoding="utf-8") as f:
-        f.write(html)
+    # Shared by the event page and its solution pages
+    generated_at = generated_at or utc_timestamp()
+    html = _generate_event_page_content(event, submission, event_data_link=event_data_link, generated_at=generated_at)
+    write_page(output_dir / f"{event.event_id}.html", html, incremental=incremental, writer=writer)
 
     # After generating the event page, generate solution pages
     for sol in event.solutions.values():
-        generate_solution_page(sol, event, submission, output_dir)
+        generate_solution_page(
+            sol, event, submission, output_dir, incremental=incremental, generated_at=generated_at, writer=writer
+        )
 
 
 def _generate_event_page_content(
@@ -75,6 +213,7 @@ def _generate_event_page_content(
     submission: Submission,
     *,
     event_data_link: str = "",
+    generated_at: Optional[str] = None,
 ) -> str:
     """Generate the HTML content for an event dossier page.
 
@@ -106,16 +245,8 @@ def _generate_event_page_content(
         probability (descending), then solution ID. The page includes
         navigation back to the dashboard and links to individual solution pages.
     """
-
-    # Sort solutions: active first, then by relative_probability (desc, None last), then by solution_id
-    def sort_key(sol):
-        return (
-            not sol.is_active,  # active first
-            -(sol.relative_probability if sol.relative_probability is not None else float("-inf")),
-            sol.solution_id,
-        )
-
-    solutions = sorted(event.solutions.values(), key=sort_key)
+    solutions = sorted(event.solutions.values(), key=_solution_sort_key)
+    project_root = Path(submission.project_path)
     # Table rows
     rows = []
     for sol in solutions:
@@ -127,22 +258,16 @@ def _generate_event_page_content(
         logl = f"{sol.log_likelihood:.2f}" if sol.log_likelihood is not None else "N/A"
         ndp = str(sol.n_data_points) if sol.n_data_points is not None else "N/A"
         relprob = f"{sol.relative_probability:.3f}" if sol.relative_probability is not None else "N/A"
-        # Read notes snippet from file
-        notes_snip = (
-            (
-                sol.get_notes(project_root=Path(submission.project_path))[:50]
-                + ("..." if len(sol.get_notes(project_root=Path(submission.project_path))) > 50 else "")
-            )
-            if sol.notes_path
-            else ""
-        )
+        # Read notes snippet from file (once per solution)
+        notes_txt = sol.get_notes(project_root=project_root) if sol.notes_path else ""
+        notes_snip = escape(notes_txt[:50]) + "..." if len(notes_txt) > 50 else escape(notes_txt)
 
         # Display alias as primary identifier, UUID as secondary
         if sol.alias:
             solution_display = f"""
                 <div>
                     <a href="{sol.solution_id}.html"
-                       class="font-medium text-rtd-accent hover:underline">{sol.alias}</a>
+                       class="font-medium text-rtd-accent hover:underline">{escape(sol.alias)}</a>
                     <div class="text-xs text-gray-500 font-mono">{sol.solution_id[:8]}...</div>
                 </div>
             """
@@ -157,7 +282,7 @@ def _generate_event_page_content(
             f"""
             <tr class='border-b border-gray-200 hover:bg-gray-50'>
                 <td class='py-3 px-4'>{solution_display}</td>
-                <td class='py-3 px-4'>{sol.model_type}</td>
+                <td class='py-3 px-4'>{escape(sol.model_type)}</td>
                 <td class='py-3 px-4'>{status}</td>
                 <td class='py-3 px-4'>{logl}</td>
                 <td class='py-3 px-4'>{ndp}</td>
@@ -166,221 +291,30 @@ def _generate_event_page_content(
             </tr>
         """
         )
-    table_body = (
-        "\n".join(rows)
-        if rows
-        else """
-        <tr class='border-b border-gray-200'>
-            <td colspan='7' class='py-3 px-4 text-center text-gray-500'>
-                No solutions found
-            </td>
-        </tr>
-    """
-    )
+    table_body = "\n".join(rows) if rows else _NO_SOLUTIONS_ROW
     # Optional raw data link
     raw_data_html = ""
     if event_data_link:
         raw_data_html = (
             f'<p class="text-rtd-text">Raw Event Data: '
-            f'<a href="{event_data_link}" '
+            f'<a href="{escape(event_data_link)}" '
             f'class="text-rtd-accent hover:underline">Download Data</a></p>'
         )
-    # HTML content
-    html = f"""<!DOCTYPE html>
-<html lang='en'>
-<head>
-    <meta charset='UTF-8'>
-    <meta name='viewport' content='width=device-width, initial-scale=1.0'>
-    <title>Event Dossier: {event.event_id} - {submission.team_name}</title>
-    <script src='https://cdn.tailwindcss.com'></script>
-    <script>
-      tailwind.config = {{
-        theme: {{
-          extend: {{
-            colors: {{
-              'rtd-primary': '#dfc5fa',
-              'rtd-secondary': '#361d49',
-              'rtd-accent': '#a859e4',
-              'rtd-background': '#faf7fd',
-              'rtd-text': '#000',
-            }},
-            fontFamily: {{
-              inter: ['Inter', 'sans-serif'],
-            }},
-          }},
-        }},
-      }};
-    </script>
-    <link href='https://fonts.googleapis.com/css2?family=Inter:wght@400;600;700&display=swap' \
-rel='stylesheet'>
-    <!-- Highlight.js for code syntax highlighting -->
-    <link rel="stylesheet" \
-href="https://cdnjs.cloudflare.com/ajax/libs/highlight.js/11.9.0/styles/github.min.css">
-    <script src="https://cdnjs.cloudflare.com/ajax/libs/highlight.js/11.9.0/highlight.min.js"></script>
-    <script>hljs.highlightAll();</script>
-    <style>
-        .prose {{
-            color: #000;
-            line-height: 1.6;
-        }}
-        .prose h1 {{
-            font-size: 1.5rem;
-            font-weight: 700;
-            color: #361d49;
-            margin-top: 1.5rem;
-            margin-bottom: 0.75rem;
-        }}
-        .prose h2 {{
-            font-size: 1.25rem;
-            font-weight: 600;
-            color: #361d49;
-            margin-top: 1.25rem;
-            margin-bottom: 0.5rem;
-        }}
-        .prose h3 {{
-            font-size: 1.125rem;
-            font-weight: 600;
-            color: #a859e4;
-            margin-top: 1rem;
-            margin-bottom: 0.5rem;
-        }}
-        .prose p {{
-            margin-bottom: 0.75rem;
-        }}
-        .prose ul, .prose ol {{
-            margin-left: 1.5rem;
-            margin-bottom: 0.75rem;
-        }}
-        .prose ul {{ list-style-type: disc; }}
-        .prose ol {{ list-style-type: decimal; }}
-        .prose li {{
-            margin-bottom: 0.25rem;
-        }}
-        .prose code {{
-            background: #f3f3f3;
-            padding: 2px 4px;
-            border-radius: 4px;
-            font-family: 'Courier New', monospace;
-            font-size: 0.875rem;
-        }}
-        .prose pre {{
-            background: #f8f8f8;
-            padding: 1rem;
-            border-radius: 8px;
-            overflow-x: auto;
-            margin: 1rem 0;
-            border: 1px solid #e5e5e5;
-        }}
-        .prose pre code {{
-            background: none;
-            padding: 0;
-        }}
-        .prose blockquote {{
-            border-left: 4px solid #a859e4;
-            padding-left: 1rem;
-            margin: 1rem 0;
-            font-style: italic;
-            color: #666;
-        }}
-    </style>
-</head>
-<body class='font-inter bg-rtd-background'>
-    <div class='max-w-7xl mx-auto p-6 lg:p-8'>
-        <div class='bg-white shadow-xl rounded-lg'>
-            <!-- Header & Navigation -->
-            <div class='text-center py-8'>
-                <img src='assets/rges-pit_logo.png' alt='RGES-PIT Logo' class='w-48 mx-auto mb-6'>
-                <h1 class='text-4xl font-bold text-rtd-secondary text-center mb-2'>
-                    Event Dossier: {event.event_id}
-                </h1>
-                <p class='text-xl text-rtd-accent text-center mb-4'>
-                    Team: {submission.team_name or 'Not specified'} | Tier: {submission.tier or 'Not specified'}
-                </p>
-                <nav class='flex justify-center space-x-4 mb-8'>
-                    <a href='index.html' class='text-rtd-accent hover:underline'>&larr; Back to Dashboard</a>
-                </nav>
-            </div>
-
-            <hr class="border-t-4 border-rtd-accent my-8 mx-8">
-
-            <!-- Regex Start -->
-
-            <!-- Event Summary -->
-            <section class='mb-10 px-8'>
-                <h2 class='text-2xl font-semibold text-rtd-secondary mb-4'>Event Overview</h2>
-                <p class='text-rtd-text'>
-                    This page provides details for microlensing event {event.event_id}.
-                </p>
-                {raw_data_html}
-            </section>
-            <!-- Solutions Table -->
-            <section class='mb-10 px-8'>
-                <h2 class='text-2xl font-semibold text-rtd-secondary mb-4'>
-                    Solutions for Event {event.event_id}
-                </h2>
-                <table class='w-full text-left table-auto border-collapse'>
-                    <thead class='bg-rtd-primary text-rtd-secondary uppercase text-sm'>
-                        <tr>
-                            <th class='py-3 px-4'>Solution ID</th>
-                            <th class='py-3 px-4'>Model Type</th>
-                            <th class='py-3 px-4'>Status</th>
-                            <th class='py-3 px-4'>Log-Likelihood</th>
-                            <th class='py-3 px-4'>N Data Points</th>
-                            <th class='py-3 px-4'>Relative Probability</th>
-                            <th class='py-3 px-4'>Notes Snippet</th>
-                        </tr>
-                    </thead>
-                    <tbody class='text-rtd-text'>
-                        {table_body}
-                    </tbody>
-                </table>
-            </section>
-            <!-- Event-Specific Data Visualizations (Evaluator-Only Placeholders) -->
-            <section class='mb-10 px-8'>
-                <h2 class='text-2xl font-semibold text-rtd-secondary mb-4'>
-                    Event Data Visualizations (Evaluator-Only)
-                </h2>
-                <p class='text-sm text-gray-500 italic mb-4'>
-                    Note: These advanced plots, including comparisons to simulation truths and
-                    other teams' results, are available in the Evaluator Dossier.
-                </p>
-                <div class='mb-6'>
-                    <img
-                        src='https://placehold.co/800x450/dfc5fa/361d49?text=Raw+Lightcurve+and+Astrometry+Data+
-                        (Evaluator+Only)'
-                        alt='Raw Data Plot'
-                        class='w-full rounded-lg shadow-md'
-                    >
-                    <p class='text-sm text-gray-600 mt-2'>
-                        Raw lightcurve and astrometry data for Event
-                        {event.event_id}, with true model overlaid (Evaluator View).
-                    </p>
-                </div>
-                <div class='mb-6'>
-                    <img src='https://placehold.co/600x400/dfc5fa/361d49?text=Mass+vs+Distance+Scatter+Plot+
-(Evaluator+Only)'
-alt='Mass vs Distance Plot' class='w-full rounded-lg shadow-md'>
-                    <p class='text-sm text-gray-600 mt-2'>Derived Lens Mass vs. Lens Distance for solutions of \
-Event {event.event_id}. Points colored by Relative Probability (Evaluator View).</p>
-                </div>
-                <div class='mb-6'>
-                    <img src='https://placehold.co/600x400/dfc5fa/361d49?text=Proper+Motion+N+vs+E+Plot+
-(Evaluator+Only)'
-alt='Proper Motion Plot' class='w-full rounded-lg shadow-md'>
-                    <p class='text-sm text-gray-600 mt-2'>Proper Motion North vs. East components for solutions of \
-Event {event.event_id}. Points colored by Relative Probability (Evaluator View).</p>
-                </div>
-            </section>
-
-            <!-- Footer -->
-            <div class='text-sm text-gray-500 text-center pt-8 border-t border-gray-200 mt-10'>
-                Generated by microlens-submit v{__version__} on {datetime.now().strftime('%Y-%m-%d %H:%M:%S UTC')}
-            </div>
-
-            <!-- Regex Finish -->
-
-        </div>
-    </div>
-</body>
-</html>"""
-    return html
+    # HTML content; user-supplied text is escaped
+    event_id = escape(event.event_id)
+    return "".join(
+        (
+            PAGE_HEAD_OPEN,
+            f"Event Dossier: {event_id} - {escape(str(submission.team_name))}",
+            PAGE_HEAD,
+            _EVENT_BODY_TEMPLATE.format(
+                event_id=event_id,
+                team_display=escape(submission.team_name) if submission.team_name else "Not specified",
+                tier_display=escape(submission.tier) if submission.tier else "Not specified",
+                raw_data_html=raw_data_html,
+                table_body=table_body,
+                version=__version__,
+                generated_at=generated_at or utc_timestamp(),
+            ),
+        )
+    )
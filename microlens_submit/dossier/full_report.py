@@ -6,19 +6,24 @@ dossier reports that combine all dashboard, event, and solution content
 into a single document.
 """
 
-import json
-from datetime import datetime
+from html import escape
 from pathlib import Path
+from typing import Optional
 
+from ..json_utils import JSONDecodeError, read_json
 from ..models import Submission
 from ..models.solution import Solution
 from .dashboard import _generate_dashboard_content
 from .event_page import _generate_event_page_content
 from .solution_page import _generate_solution_page_content
-from .utils import resolve_dossier_asset_path
+from .utils import resolve_dossier_asset_path, utc_timestamp
 
 
-def generate_full_dossier_report_html(submission: Submission, output_dir: Path) -> None:
+def generate_full_dossier_report_html(
+    submission: Submission,
+    output_dir: Path,
+    generated_at: Optional[str] = None,
+) -> None:
     """Generate a comprehensive printable HTML dossier report.
 
     Creates a single HTML file that concatenates all dossier sections (dashboard,
@@ -30,6 +35,8 @@ def generate_full_dossier_report_html(submission: Submission, output_dir: Path)
         submission: The submission object containing all events and solutions.
         output_dir: Directory where the full dossier report will be saved.
             The file will be named full_dossier_report.html.
+        generated_at: Timestamp shown in the report; defaults to the current
+            UTC time.
 
     Raises:
         OSError: If unable to write the HTML file.
@@ -57,8 +64,9 @@ def generate_full_dossier_report_html(submission: Submission, output_dir: Path)
         generate_dashboard_html() when creating a full dossier.
     """
     all_html_sections = []
+    now = generated_at or utc_timestamp()
     # Dashboard (extract only main content, skip header/logo)
-    dash_html = _generate_dashboard_content(submission, full_dossier_exists=True)
+    dash_html = _generate_dashboard_content(submission, full_dossier_exists=True, generated_at=now)
     dash_body = extract_main_content_body(dash_html)
     all_html_sections.append(dash_body)
     all_html_sections.append('<hr class="my-8 border-t-2 border-rtd-accent">')  # Divider after dashboard
@@ -75,7 +83,9 @@ def generate_full_dossier_report_html(submission: Submission, output_dir: Path)
                 subdir="event-data",
                 prefix=f"{event.event_id}_event_data",
             )
-        event_html = _generate_event_page_content(event, submission, event_data_link=event_data_link)
+        event_html = _generate_event_page_content(
+            event, submission, event_data_link=event_data_link, generated_at=now
+        )
         event_body = extract_main_content_body(event_html, section_type="event", section_id=event.event_id)
         all_html_sections.append(event_body)
         all_html_sections.append('<hr class="my-8 border-t-2 border-rtd-accent">')  # Divider after event
@@ -109,6 +119,7 @@ def generate_full_dossier_report_html(submission: Submission, output_dir: Path)
                 lc_plot=lc_plot,
                 lens_plot=lens_plot,
                 posterior=posterior,
+                generated_at=now,
             )
             sol_body = extract_main_content_body(
                 sol_html,
@@ -121,14 +132,13 @@ def generate_full_dossier_report_html(submission: Submission, output_dir: Path)
             all_html_sections.append('<hr class="my-8 border-t-2 border-rtd-accent">')  # Divider after solution
 
     # Compose the full HTML
-    now = datetime.now().strftime("%Y-%m-%d %H:%M:%S UTC")
     header = f"""
     <div class="text-center py-8 bg-rtd-primary text-rtd-secondary">
         <img src='assets/rges-pit_logo.png' alt='RGES-PIT Logo' class='w-48 mx-auto mb-6'>
         <h1 class="text-3xl font-bold mb-2">Comprehensive Submission Dossier</h1>
         <p class="text-lg">Generated on: {now}</p>
         <p class="text-md">
-            Team: {submission.team_name} | Tier: {submission.tier}
+            Team: {escape(str(submission.team_name))} | Tier: {escape(str(submission.tier))}
         </p>
     </div>
     <hr class="border-t-4 border-rtd-accent my-8">
@@ -138,26 +148,9 @@ def generate_full_dossier_report_html(submission: Submission, output_dir: Path)
 <head>
     <meta charset="UTF-8">
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>Full Dossier Report - {submission.team_name}</title>
+    <title>Full Dossier Report - {escape(str(submission.team_name))}</title>
     <script src="https://cdn.tailwindcss.com"></script>
-    <script>
-      tailwind.config = {{
-        theme: {{
-          extend: {{
-            colors: {{
-              'rtd-primary': '#dfc5fa',
-              'rtd-secondary': '#361d49',
-              'rtd-accent': '#a859e4',
-              'rtd-background': '#faf7fd',
-              'rtd-text': '#000',
-            }},
-            fontFamily: {{
-              inter: ['Inter', 'sans-serif'],
-            }},
-          }},
-        }},
-      }};
-    </script>
+    <script src="assets/tailwind-init.js"></script>
     <link
         href="https://fonts.googleapis.com/css2?family=Inter:wght@400;600;700&display=swap"
         rel="stylesheet"
@@ -243,8 +236,7 @@ def generate_full_dossier_report_html(submission: Submission, output_dir: Path)
     </div>
 </body>
 </html>"""
-    with (output_dir / "full_dossier_report.html").open("w", encoding="utf-8") as f:
-        f.write(html)
+    (output_dir / "full_dossier_report.html").write_bytes(html.encode("utf-8"))
 
 
 def extract_main_content_body(
@@ -344,21 +336,20 @@ def extract_main_content_body(
                 aliases_file = project_root / "aliases.json"
                 if aliases_file.exists():
                     try:
-                        with aliases_file.open("r", encoding="utf-8") as f:
-                            aliases = json.load(f)
+                        aliases = read_json(aliases_file)
                         # Look up the solution_id in the aliases
                         for key, uuid in aliases.items():
                             if uuid == section_id:
                                 alias_key = key
                                 break
-                    except (json.JSONDecodeError, KeyError):
+                    except (JSONDecodeError, KeyError):
                         pass
 
             # Get model type from solution object
-            model_type = solution.model_type if solution else "Unknown"
+            model_type = escape(solution.model_type) if solution else "Unknown"
 
             if alias_key:
-                heading = f"""<h2 class="text-3xl font-bold text-rtd-accent my-6">Solution: {alias_key}</h2>
+                heading = f"""<h2 class="text-3xl font-bold text-rtd-accent my-6">Solution: {escape(alias_key)}</h2>
                 <h3 class="text-lg text-gray-600 mb-4">Model Type: {model_type} | UUID: {section_id}</h3>"""
             else:
                 heading = f"""<h2 class="text-3xl font-bold text-rtd-accent my-6">Solution: {section_id}</h2>
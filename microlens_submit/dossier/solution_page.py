@@ -6,322 +6,39 @@ microlensing solutions, including solution overview, parameter tables,
 notes rendering, and evaluator-only sections.
 """
 
-from datetime import datetime
+import functools
+from html import escape
 from pathlib import Path
-from typing import Optional
-
-import markdown
+from typing import TYPE_CHECKING, Optional
 
 from .. import __version__
 from ..models.event import Event
 from ..models.solution import Solution
 from ..models.submission import Submission
-from .utils import resolve_dossier_asset_path
-
-
-def generate_solution_page(solution: Solution, event: Event, submission: Submission, output_dir: Path) -> None:
-    """Generate an HTML dossier page for a single solution.
-
-    Creates a detailed HTML page for a specific microlensing solution, following
-    the Solution_Page_Design.md specification. The page includes solution overview,
-    parameter tables, notes (with markdown rendering), and evaluator-only sections.
-
-    Args:
-        solution: The Solution object containing parameters, notes, and metadata.
-        event: The parent Event object for context and navigation.
-        submission: The grandparent Submission object for context and metadata.
-        output_dir: The dossier directory where the HTML file will be saved.
-            The file will be named {solution.solution_id}.html.
+from .templates import PAGE_HEAD, PAGE_HEAD_OPEN
+from .utils import BackgroundWriter, resolve_dossier_asset_path, utc_timestamp, write_page
 
-    Raises:
-        OSError: If unable to write the HTML file or read notes file.
-        ValueError: If solution data is invalid.
-
-    Example:
-        >>> from microlens_submit import load
-        >>> from microlens_submit.dossier import generate_solution_page
-        >>> from pathlib import Path
-        >>>
-        >>> submission = load("./my_project")
-        >>> event = submission.get_event("EVENT001")
-        >>> solution = event.get_solution("solution_uuid_here")
-        >>>
-        >>> # Generate solution page
-        >>> generate_solution_page(solution, event, submission, Path("./dossier_output"))
-        >>>
-        >>> # Creates: ./dossier_output/solution_uuid_here.html
+if TYPE_CHECKING:
+    import markdown
 
-    Note:
-        The solution page includes GitHub commit links if available, markdown
-        rendering for notes, and navigation back to the event page and dashboard.
-        Notes are rendered with syntax highlighting for code blocks.
-    """
-    # Prepare output directory (already created)
-    project_root = Path(submission.project_path)
-    lc_plot = resolve_dossier_asset_path(
-        solution.lightcurve_plot_path,
-        project_root,
-        output_dir,
-        subdir="plots",
-        prefix=f"{event.event_id}_{solution.solution_id}_lightcurve",
-    )
-    lens_plot = resolve_dossier_asset_path(
-        solution.lens_plane_plot_path,
-        project_root,
-        output_dir,
-        subdir="plots",
-        prefix=f"{event.event_id}_{solution.solution_id}_lens",
-    )
-    posterior = resolve_dossier_asset_path(
-        solution.posterior_path,
-        project_root,
-        output_dir,
-        subdir="posteriors",
-        prefix=f"{event.event_id}_{solution.solution_id}_posterior",
-    )
-    html = _generate_solution_page_content(
-        solution,
-        event,
-        submission,
-        lc_plot=lc_plot,
-        lens_plot=lens_plot,
-        posterior=posterior,
-    )
-    with (output_dir / f"{solution.solution_id}.html").open("w", encoding="utf-8") as f:
-        f.write(html)
-
-
-def _generate_solution_page_content(
-    solution: Solution,
-    event: Event,
-    submission: Submission,
-    *,
-    lc_plot: Optional[str] = None,
-    lens_plot: Optional[str] = None,
-    posterior: Optional[str] = None,
-) -> str:
-    """Generate the HTML content for a solution dossier page.
-
-    Creates the complete HTML content for a single solution page, including
-    parameter tables, markdown-rendered notes, plot placeholders, and
-    evaluator-only sections.
-
-    Args:
-        solution: The Solution object containing parameters, notes, and metadata.
-        event: The parent Event object for context and navigation.
-        submission: The grandparent Submission object for context and metadata.
-
-    Returns:
-        str: Complete HTML content as a string for the solution page.
-
-    Example:
-        >>> from microlens_submit import load
-        >>> from microlens_submit.dossier import _generate_solution_page_content
-        >>>
-        >>> submission = load("./my_project")
-        >>> event = submission.get_event("EVENT001")
-        >>> solution = event.get_solution("solution_uuid_here")
-        >>> html_content = _generate_solution_page_content(solution, event, submission)
-        >>>
-        >>> # Write to file
-        >>> with open("solution_page.html", "w", encoding="utf-8") as f:
-        ...     f.write(html_content)
-
-    Note:
-        Parameter uncertainties are formatted as ±value or +upper/-lower
-        depending on the uncertainty format. Notes are rendered from markdown
-        with syntax highlighting for code blocks. GitHub commit links are
-        included if git information is available in compute_info.
-    """
-    # Placeholder image URLs
-    PARAM_COMPARISON_URL = "https://placehold.co/800x300/dfc5fa/361d49?text=Parameter+Comparison"
-    PARAM_DIFFERENCE_URL = "https://placehold.co/800x400/dfc5fa/361d49?text=Parameter+Difference"
-    PHYSICAL_PARAM_URL = "https://placehold.co/600x400/dfc5fa/361d49?text=Physical+Parameter"
-    CMD_WITH_SOURCE_URL = "https://placehold.co/600x400/dfc5fa/361d49?text=CMD+with+Source"
-    DATA_UTILIZATION_URL = "https://placehold.co/600x100/dfc5fa/361d49?text=Data+Utilization+Infographic"
-    # Render notes as HTML from file
-    notes_md = solution.get_notes(project_root=Path(submission.project_path))
-    notes_html = markdown.markdown(notes_md or "", extensions=["extra", "tables", "fenced_code", "nl2br"])
-    # Parameters table
-    param_rows = []
-    params = solution.parameters or {}
-    uncertainties = solution.parameter_uncertainties or {}
-    for k, v in params.items():
-        unc = uncertainties.get(k)
-        if unc is None:
-            unc_str = "N/A"
-        elif isinstance(unc, (list, tuple)) and len(unc) == 2:
-            unc_str = f"+{unc[1]}/-{unc[0]}"
-        else:
-            unc_str = f"±{unc}"
-        param_rows.append(
-            f"""
-            <tr class='border-b border-gray-200 hover:bg-gray-50'>
-                <td class='py-3 px-4'>{k}</td>
-                <td class='py-3 px-4'>{v}</td>
-                <td class='py-3 px-4'>{unc_str}</td>
-            </tr>
-        """
-        )
-    param_table = (
-        "\n".join(param_rows)
-        if param_rows
-        else """
+_NO_PARAMETERS_ROW = """
         <tr class='border-b border-gray-200'>
             <td colspan='3' class='py-3 px-4 text-center text-gray-500'>
                 No parameters found
             </td>
         </tr>
     """
-    )
-    # Higher-order effects
-    hoe_str = ", ".join(solution.higher_order_effects) if solution.higher_order_effects else "None"
-    # Plot paths (relative to solution page)
-    lc_plot = lc_plot if lc_plot is not None else (solution.lightcurve_plot_path or "")
-    lens_plot = lens_plot if lens_plot is not None else (solution.lens_plane_plot_path or "")
-    posterior = posterior if posterior is not None else (solution.posterior_path or "")
-    # Physical parameters table
-    phys_rows = []
-    phys = solution.physical_parameters or {}
-    for k, v in phys.items():
-        phys_rows.append(
-            f"""
-            <tr class='border-b border-gray-200 hover:bg-gray-50'>
-                <td class='py-3 px-4'>{k}</td>
-                <td class='py-3 px-4'>{v}</td>
-            </tr>
-        """
-        )
-    phys_table = (
-        "\n".join(phys_rows)
-        if phys_rows
-        else """
+
+_NO_PHYSICAL_PARAMETERS_ROW = """
         <tr class='border-b border-gray-200'>
             <td colspan='2' class='py-3 px-4 text-center text-gray-500'>
                 No physical parameters found
             </td>
         </tr>
     """
-    )
-    # GitHub commit link (if present)
-    repo_url = getattr(submission, "repo_url", None) or (
-        submission.repo_url if hasattr(submission, "repo_url") else None
-    )
-    commit = None
-    if solution.compute_info:
-        git_info = solution.compute_info.get("git_info")
-        if git_info:
-            commit = git_info.get("commit")
-    commit_html = ""
-    if repo_url and commit:
-        commit_short = commit[:8]
-        commit_url = f"{repo_url.rstrip('/')}/commit/{commit}"
-        commit_html = f"""<a href="{commit_url}" target="_blank" rel="noopener"
-               title="View this commit on GitHub"
-               class="inline-flex items-center space-x-1 ml-2 align-middle">
-                <img src="assets/github-desktop_logo.png" alt="GitHub Commit"
-                     class="w-4 h-4 inline-block align-middle"
-                     style="display:inline;vertical-align:middle;">
-                <span class="text-xs text-rtd-accent font-mono">{commit_short}</span>
-            </a>"""
-    # HTML content
-    html = f"""<!DOCTYPE html>
-<html lang='en'>
-<head>
-    <meta charset='UTF-8'>
-    <meta name='viewport' content='width=device-width, initial-scale=1.0'>
-    <title>Solution Dossier: {solution.alias or solution.solution_id[:8] + '...'} - {submission.team_name}</title>
-    <script src='https://cdn.tailwindcss.com'></script>
-    <script>
-      tailwind.config = {{
-        theme: {{
-          extend: {{
-            colors: {{
-              'rtd-primary': '#dfc5fa',
-              'rtd-secondary': '#361d49',
-              'rtd-accent': '#a859e4',
-              'rtd-background': '#faf7fd',
-              'rtd-text': '#000',
-            }},
-            fontFamily: {{
-              inter: ['Inter', 'sans-serif'],
-            }},
-          }},
-        }},
-      }};
-    </script>
-    <link href='https://fonts.googleapis.com/css2?family=Inter:wght@400;600;700&display=swap' rel='stylesheet'>
-    <!-- Highlight.js for code syntax highlighting -->
-    <link rel="stylesheet" href="https://cdnjs.cloudflare.com/ajax/libs/highlight.js/11.9.0/styles/github.min.css">
-    <script src="https://cdnjs.cloudflare.com/ajax/libs/highlight.js/11.9.0/highlight.min.js"></script>
-    <script>hljs.highlightAll();</script>
-    <style>
-        .prose {{
-            color: #000;
-            line-height: 1.6;
-        }}
-        .prose h1 {{
-            font-size: 1.5rem;
-            font-weight: 700;
-            color: #361d49;
-            margin-top: 1.5rem;
-            margin-bottom: 0.75rem;
-        }}
-        .prose h2 {{
-            font-size: 1.25rem;
-            font-weight: 600;
-            color: #361d49;
-            margin-top: 1.25rem;
-            margin-bottom: 0.5rem;
-        }}
-        .prose h3 {{
-            font-size: 1.125rem;
-            font-weight: 600;
-            color: #a859e4;
-            margin-top: 1rem;
-            margin-bottom: 0.5rem;
-        }}
-        .prose p {{
-            margin-bottom: 0.75rem;
-        }}
-        .prose ul, .prose ol {{
-            margin-left: 1.5rem;
-            margin-bottom: 0.75rem;
-        }}
-        .prose ul {{ list-style-type: disc; }}
-        .prose ol {{ list-style-type: decimal; }}
-        .prose li {{
-            margin-bottom: 0.25rem;
-        }}
-        .prose code {{
-            background: #f3f3f3;
-            padding: 2px 4px;
-            border-radius: 4px;
-            font-family: 'Courier New', monospace;
-            font-size: 0.875rem;
-        }}
-        .prose pre {{
-            background: #f8f8f8;
-            padding: 1rem;
-            border-radius: 8px;
-            overflow-x: auto;
-            margin: 1rem 0;
-            border: 1px solid #e5e5e5;
-        }}
-        .prose pre code {{
-            background: none;
-            padding: 0;
-        }}
-        .prose blockquote {{
-            border-left: 4px solid #a859e4;
-            padding-left: 1rem;
-            margin: 1rem 0;
-            font-style: italic;
-            color: #666;
-        }}
-    </style>
-</head>
-<body class='font-inter bg-rtd-background'>
+
+# Page body after </head>, filled in with str.format().
+_SOLUTION_BODY_TEMPLATE = """<body class='font-inter bg-rtd-background'>
     <div class='max-w-7xl mx-auto p-6 lg:p-8'>
         <div class='bg-white shadow-xl rounded-lg'>
             <!-- Header & Navigation -->
@@ -329,25 +46,24 @@ def _generate_solution_page_content(
                 <img src='assets/rges-pit_logo.png' alt='RGES-PIT Logo' class='w-48 mx-auto mb-6'>
                 <h1 class='text-4xl font-bold text-rtd-secondary text-center mb-2'>
                     Solution Dossier:
-                    {solution.alias or solution.solution_id[:8] + '...'}
+                    {display_name}
                 </h1>
                 <p class='text-lg text-gray-600 text-center mb-2'>
                     Model Type:
-                    <span class='font-mono bg-gray-100 px-2 py-1 rounded'>{solution.model_type}</span>
+                    <span class='font-mono bg-gray-100 px-2 py-1 rounded'>{model_type}</span>
                 </p>
-                <p class='text-xl text-rtd-accent text-center mb-4'>Event: {event.event_id} | Team: (
-                    {submission.team_name or 'Not specified'} |
-                    Tier: {submission.tier or 'Not specified'}
+                <p class='text-xl text-rtd-accent text-center mb-4'>Event: {event_id} | Team: (
+                    {team_display} |
+                    Tier: {tier_display}
                     {commit_html}
                 )</p>
-                {f"<p class='text-lg text-gray-600 text-center mb-2'>UUID: {solution.solution_id}</p>"
-                 if solution.alias else ""}
+                {uuid_html}
                 <nav class='flex justify-center space-x-4 mb-8'>
                     <a
-                        href='{event.event_id}.html'
+                        href='{event_id}.html'
                         class='text-rtd-accent hover:underline'
                     >
-                        &larr; Back to Event {event.event_id}
+                        &larr; Back to Event {event_id}
                     </a>
                     <a href='index.html' class='text-rtd-accent hover:underline'>&larr; Back to Dashboard</a>
                 </nav>
@@ -384,22 +100,20 @@ def _generate_solution_page_content(
                         >
                         <p class="text-sm text-rtd-secondary">
                             Caption: Lightcurve fit for Solution
-                            {solution.alias or solution.solution_id[:8] + '...'}
+                            {display_name}
                         </p>
                     </div>
                     <div class='text-center bg-rtd-primary p-4 rounded-lg shadow-md'>
                         <img src='{lens_plot}' alt='Lens Plane Plot' class='w-full h-auto rounded-md mb-2'>
                         <p class='text-sm text-rtd-secondary'>
                             Caption: Lens plane geometry for Solution
-                            {solution.alias or solution.solution_id[:8] + '...'}
+                            {display_name}
                         </p>
                     </div>
                 </div>
                 <p class='text-rtd-text mt-4 text-center'>
                     Posterior Samples:
-                    {f"<a href='{posterior}' class='text-rtd-accent hover:underline'>"
-                     f"Download Posterior Data</a>"
-                     if posterior else ''}
+                    {posterior_html}
                 </p>
             </section>
             <!-- Fit Statistics & Data Utilization -->
@@ -411,13 +125,13 @@ def _generate_solution_page_content(
                     <div class='bg-rtd-primary p-6 rounded-lg shadow-md text-center'>
                         <p class='text-sm font-medium text-rtd-secondary'>Log-Likelihood</p>
                         <p class='text-4xl font-bold text-rtd-accent mt-2'>
-                            {solution.log_likelihood if solution.log_likelihood is not None else 'N/A'}
+                            {log_likelihood}
                         </p>
                     </div>
                     <div class='bg-rtd-primary p-6 rounded-lg shadow-md text-center'>
                         <p class='text-sm font-medium text-rtd-secondary'>N Data Points Used</p>
                         <p class='text-4xl font-bold text-rtd-accent mt-2'>
-                            {solution.n_data_points if solution.n_data_points is not None else 'N/A'}
+                            {n_data_points}
                         </p>
                     </div>
                 </div>
@@ -426,7 +140,7 @@ def _generate_solution_page_content(
                 </h3>
                 <div class='text-center bg-rtd-primary p-4 rounded-lg shadow-md'>
                     <img
-                        src='{DATA_UTILIZATION_URL}'
+                        src='https://placehold.co/600x100/dfc5fa/361d49?text=Data+Utilization+Infographic'
                         alt='Data Utilization'
                         class='w-full h-auto rounded-md mb-2'
                     >
@@ -451,15 +165,14 @@ def _generate_solution_page_content(
                         <tr>
                             <td>CPU Hours</td>
                             <td>
-                                {solution.compute_info.get('cpu_hours', 'N/A') if solution.compute_info else 'N/A'}
+                                {cpu_hours}
                             </td>
                             <td>N/A for Participants</td><td>N/A for Participants</td>
                         </tr>
                         <tr>
                             <td>Wall Time (Hrs)</td>
                             <td>
-                                {solution.compute_info.get('wall_time_hours', 'N/A')
-                                 if solution.compute_info else 'N/A'}
+                                {wall_time_hours}
                             </td>
                             <td>N/A for Participants</td><td>N/A for Participants</td>
                         </tr>
@@ -481,7 +194,7 @@ def _generate_solution_page_content(
                 </p>
                 <div class='text-center bg-rtd-primary p-4 rounded-lg shadow-md'>
                     <img
-                        src='{PARAM_COMPARISON_URL}'
+                        src='https://placehold.co/800x300/dfc5fa/361d49?text=Parameter+Comparison'
                         alt='Parameter Comparison Table'
                         class='w-full h-auto rounded-md mb-2'
                     >
@@ -492,7 +205,7 @@ def _generate_solution_page_content(
                 </div>
                 <div class='text-center bg-rtd-primary p-4 rounded-lg shadow-md mt-6'>
                     <img
-                        src='{PARAM_DIFFERENCE_URL}'
+                        src='https://placehold.co/800x400/dfc5fa/361d49?text=Parameter+Difference'
                         alt='Parameter Difference Distributions'
                         class='w-full h-auto rounded-md mb-2'
                     >
@@ -523,7 +236,7 @@ def _generate_solution_page_content(
                 </table>
                 <div class='text-center bg-rtd-primary p-4 rounded-lg shadow-md mt-6'>
                     <img
-                        src='{PHYSICAL_PARAM_URL}'
+                        src='https://placehold.co/600x400/dfc5fa/361d49?text=Physical+Parameter'
                         alt='Physical Parameter Distribution'
                         class='w-full h-auto rounded-md mb-2'
                     >
@@ -548,7 +261,7 @@ def _generate_solution_page_content(
                 </div>
                 <div class='text-center bg-rtd-primary p-4 rounded-lg shadow-md mt-6'>
                     <img
-                        src='{CMD_WITH_SOURCE_URL}'
+                        src='https://placehold.co/600x400/dfc5fa/361d49?text=CMD+with+Source'
                         alt='Color-Magnitude Diagram'
                         class='w-full h-auto rounded-md mb-2'
                     >
@@ -561,7 +274,7 @@ def _generate_solution_page_content(
 
             <!-- Footer -->
             <div class='text-sm text-gray-500 text-center pt-8 border-t border-gray-200 mt-10'>
-                Generated by microlens-submit v{__version__} on {datetime.now().strftime('%Y-%m-%d %H:%M:%S UTC')}
+                Generated by microlens-submit v{version} on {generated_at}
             </div>
 
             <!-- Regex Finish -->
@@ -570,4 +283,268 @@ def _generate_solution_page_content(
     </div>
 </body>
 </html>"""
-    return html
+
+
+def _format_uncertainty(unc: object) -> str:
+    """Format a parameter uncertainty for the parameter table (HTML-escaped).
+
+    ``[lower, upper]`` pairs are shown as ``+upper/-lower``, scalars as
+    ``±value`` and missing uncertainties as ``N/A``.
+    """
+    if unc is None:
+        return "N/A"
+    if isinstance(unc, (list, tuple)) and len(unc) == 2:
+        return escape(f"+{unc[1]}/-{unc[0]}")
+    return escape(f"±{unc}")
+
+
+@functools.lru_cache(maxsize=None)
+def _markdown_renderer() -> "markdown.Markdown":
+    """Return the shared Markdown converter used for solution notes.
+
+    ``markdown.markdown()`` builds a new converter, loading every extension,
+    on each call; the converter is built once instead and reset between
+    documents. The package is imported here, on first use, so importing the
+    dossier modules (and starting the CLI) does not pay for it.
+    """
+    import markdown
+
+    return markdown.Markdown(extensions=["extra", "tables", "fenced_code", "nl2br"])
+
+
+@functools.lru_cache(maxsize=1024)
+def _render_notes_html(notes_md: str) -> str:
+    """Render Markdown notes to HTML, memoized on the notes text.
+
+    A full dossier renders every solution twice (its own page and the
+    printable report), and repeated generations usually see unchanged notes.
+    """
+    # Markdown instances keep per-document state, hence reset()
+    return _markdown_renderer().reset().convert(notes_md)
+
+
+def generate_solution_page(
+    solution: Solution,
+    event: Event,
+    submission: Submission,
+    output_dir: Path,
+    incremental: bool = False,
+    generated_at: Optional[str] = None,
+    writer: Optional[BackgroundWriter] = None,
+) -> None:
+    """Generate an HTML dossier page for a single solution.
+
+    Creates a detailed HTML page for a specific microlensing solution, following
+    the Solution_Page_Design.md specification. The page includes solution overview,
+    parameter tables, notes (with markdown rendering), and evaluator-only sections.
+
+    Args:
+        solution: The Solution object containing parameters, notes, and metadata.
+        event: The parent Event object for context and navigation.
+        submission: The grandparent Submission object for context and metadata.
+        output_dir: The dossier directory where the HTML file will be saved.
+            The file will be named {solution.solution_id}.html.
+        incremental: If True, the page is not rewritten when its content
+            is unchanged on disk (see :func:`write_page`).
+        generated_at: Footer timestamp; defaults to the current UTC time.
+        writer: Optional :class:`BackgroundWriter` that performs the write.
+
+    Raises:
+        OSError: If unable to write the HTML file or read notes file.
+        ValueError: If solution data is invalid.
+
+    Example:
+        >>> from microlens_submit import load
+        >>> from microlens_submit.dossier import generate_solution_page
+        >>> from pathlib import Path
+        >>>
+        >>> submission = load("./my_project")
+        >>> event = submission.get_event("EVENT001")
+        >>> solution = event.get_solution("solution_uuid_here")
+        >>>
+        >>> # Generate solution page
+        >>> generate_solution_page(solution, event, submission, Path("./dossier_output"))
+        >>>
+        >>> # Creates: ./dossier_output/solution_uuid_here.html
+
+    Note:
+        The solution page includes GitHub commit links if available, markdown
+        rendering for notes, and navigation back to the event page and dashboard.
+        Notes are rendered with syntax highlighting for code blocks.
+    """
+    # Prepare output directory (already created)
+    project_root = Path(submission.project_path)
+    lc_plot = resolve_dossier_asset_path(
+        solution.lightcurve_plot_path,
+        project_root,
+        output_dir,
+        subdir="plots",
+        prefix=f"{event.event_id}_{solution.solution_id}_lightcurve",
+    )
+    lens_plot = resolve_dossier_asset_path(
+        solution.lens_plane_plot_path,
+        project_root,
+        output_dir,
+        subdir="plots",
+        prefix=f"{event.event_id}_{solution.solution_id}_lens",
+    )
+    posterior = resolve_dossier_asset_path(
+        solution.posterior_path,
+        project_root,
+        output_dir,
+        subdir="posteriors",
+        prefix=f"{event.event_id}_{solution.solution_id}_posterior",
+    )
+    html = _generate_solution_page_content(
+        solution,
+        event,
+        submission,
+        lc_plot=lc_plot,
+        lens_plot=lens_plot,
+        posterior=posterior,
+        generated_at=generated_at,
+    )
+    write_page(output_dir / f"{solution.solution_id}.html", html, incremental=incremental, writer=writer)
+
+
+def _generate_solution_page_content(
+    solution: Solution,
+    event: Event,
+    submission: Submission,
+    *,
+    lc_plot: Optional[str] = None,
+    lens_plot: Optional[str] = None,
+    posterior: Optional[str] = None,
+    generated_at: Optional[str] = None,
+) -> str:
+    """Generate the HTML content for a solution dossier page.
+
+    Creates the complete HTML content for a single solution page, including
+    parameter tables, markdown-rendered notes, plot placeholders, and
+    evaluator-only sections.
+
+    Args:
+        solution: The Solution object containing parameters, notes, and metadata.
+        event: The parent Event object for context and navigation.
+        submission: The grandparent Submission object for context and metadata.
+
+    Returns:
+        str: Complete HTML content as a string for the solution page.
+
+    Example:
+        >>> from microlens_submit import load
+        >>> from microlens_submit.dossier import _generate_solution_page_content
+        >>>
+        >>> submission = load("./my_project")
+        >>> event = submission.get_event("EVENT001")
+        >>> solution = event.get_solution("solution_uuid_here")
+        >>> html_content = _generate_solution_page_content(solution, event, submission)
+        >>>
+        >>> # Write to file
+        >>> with open("solution_page.html", "w", encoding="utf-8") as f:
+        ...     f.write(html_content)
+
+    Note:
+        Parameter uncertainties are formatted as ±value or +upper/-lower
+        depending on the uncertainty format. Notes are rendered from markdown
+        with syntax highlighting for code blocks. GitHub commit links are
+        included if git information is available in compute_info.
+    """
+    # Render notes as HTML from file
+    notes_md = solution.get_notes(project_root=Path(submission.project_path))
+    notes_html = _render_notes_html(notes_md or "")
+    # Parameters table
+    param_rows = []
+    params = solution.parameters or {}
+    uncertainties = solution.parameter_uncertainties or {}
+    for k, v in params.items():
+        param_rows.append(
+            f"""
+            <tr class='border-b border-gray-200 hover:bg-gray-50'>
+                <td class='py-3 px-4'>{escape(str(k))}</td>
+                <td class='py-3 px-4'>{escape(str(v))}</td>
+                <td class='py-3 px-4'>{_format_uncertainty(uncertainties.get(k))}</td>
+            </tr>
+        """
+        )
+    param_table = "\n".join(param_rows) if param_rows else _NO_PARAMETERS_ROW
+    # Higher-order effects
+    hoe_str = escape(", ".join(solution.higher_order_effects)) if solution.higher_order_effects else "None"
+    # Plot paths (relative to solution page)
+    lc_plot = lc_plot if lc_plot is not None else (solution.lightcurve_plot_path or "")
+    lens_plot = lens_plot if lens_plot is not None else (solution.lens_plane_plot_path or "")
+    posterior = posterior if posterior is not None else (solution.posterior_path or "")
+    # Physical parameters table
+    phys_rows = []
+    phys = solution.physical_parameters or {}
+    for k, v in phys.items():
+        phys_rows.append(
+            f"""
+            <tr class='border-b border-gray-200 hover:bg-gray-50'>
+                <td class='py-3 px-4'>{escape(str(k))}</td>
+                <td class='py-3 px-4'>{escape(str(v))}</td>
+            </tr>
+        """
+        )
+    phys_table = "\n".join(phys_rows) if phys_rows else _NO_PHYSICAL_PARAMETERS_ROW
+    # GitHub commit link (if present)
+    repo_url = getattr(submission, "repo_url", None) or (
+        submission.repo_url if hasattr(submission, "repo_url") else None
+    )
+    commit = None
+    if solution.compute_info:
+        git_info = solution.compute_info.get("git_info")
+        if git_info:
+            commit = git_info.get("commit")
+    commit_html = ""
+    if repo_url and commit:
+        commit_short = escape(commit[:8])
+        commit_url = escape(f"{repo_url.rstrip('/')}/commit/{commit}")
+        commit_html = f"""<a href="{commit_url}" target="_blank" rel="noopener"
+               title="View this commit on GitHub"
+               class="inline-flex items-center space-x-1 ml-2 align-middle">
+                <img src="assets/github-desktop_logo.png" alt="GitHub Commit"
+                     class="w-4 h-4 inline-block align-middle"
+                     style="display:inline;vertical-align:middle;">
+                <span class="text-xs text-rtd-accent font-mono">{commit_short}</span>
+            </a>"""
+    display_name = escape(solution.alias) if solution.alias else solution.solution_id[:8] + "..."
+    uuid_html = (
+        f"<p class='text-lg text-gray-600 text-center mb-2'>UUID: {solution.solution_id}</p>" if solution.alias else ""
+    )
+    posterior_html = ""
+    if posterior:
+        posterior_html = (
+            f"<a href='{escape(posterior)}' class='text-rtd-accent hover:underline'>Download Posterior Data</a>"
+        )
+    compute_info = solution.compute_info
+    # HTML content
+    return "".join(
+        (
+            PAGE_HEAD_OPEN,
+            f"Solution Dossier: {display_name} - {escape(str(submission.team_name))}",
+            PAGE_HEAD,
+            _SOLUTION_BODY_TEMPLATE.format(
+                display_name=display_name,
+                model_type=escape(solution.model_type),
+                event_id=escape(event.event_id),
+                team_display=escape(submission.team_name) if submission.team_name else "Not specified",
+                tier_display=escape(submission.tier) if submission.tier else "Not specified",
+                commit_html=commit_html,
+                uuid_html=uuid_html,
+                param_table=param_table,
+                hoe_str=hoe_str,
+                notes_html=notes_html,
+                lc_plot=escape(lc_plot),
+                lens_plot=escape(lens_plot),
+                posterior_html=posterior_html,
+                log_likelihood=solution.log_likelihood if solution.log_likelihood is not None else "N/A",
+                n_data_points=solution.n_data_points if solution.n_data_points is not None else "N/A",
+                cpu_hours=compute_info.get("cpu_hours", "N/A") if compute_info else "N/A",
+                wall_time_hours=compute_info.get("wall_time_hours", "N/A") if compute_info else "N/A",
+                phys_table=phys_table,
+                version=__version__,
+                generated_at=generated_at or utc_timestamp(),
+            ),
+        )
+    )
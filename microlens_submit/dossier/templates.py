@@ -0,0 +1,93 @@
+"""
+Shared HTML fragments for dossier pages.
+
+The event and solution pages use the same ``<head>`` boilerplate (Tailwind
+CDN and theme script, fonts, syntax highlighting and prose styles). It is kept here
+as a plain module-level string so it is built once at import and spliced into
+every page instead of being re-formatted per page.
+"""
+
+# Start of every page up to the opening <title> tag.
+PAGE_HEAD_OPEN = """<!DOCTYPE html>
+<html lang='en'>
+<head>
+    <meta charset='UTF-8'>
+    <meta name='viewport' content='width=device-width, initial-scale=1.0'>
+    <title>"""
+
+# Everything from the closing </title> tag to </head>; no placeholders.
+PAGE_HEAD = """</title>
+    <script src='https://cdn.tailwindcss.com'></script>
+    <script src='assets/tailwind-init.js'></script>
+    <link href='https://fonts.googleapis.com/css2?family=Inter:wght@400;600;700&display=swap' rel='stylesheet'>
+    <!-- Highlight.js for code syntax highlighting -->
+    <link rel="stylesheet" href="https://cdnjs.cloudflare.com/ajax/libs/highlight.js/11.9.0/styles/github.min.css">
+    <script src="https://cdnjs.cloudflare.com/ajax/libs/highlight.js/11.9.0/highlight.min.js"></script>
+    <script>hljs.highlightAll();</script>
+    <style>
+        .prose {
+            color: #000;
+            line-height: 1.6;
+        }
+        .prose h1 {
+            font-size: 1.5rem;
+            font-weight: 700;
+            color: #361d49;
+            margin-top: 1.5rem;
+            margin-bottom: 0.75rem;
+        }
+        .prose h2 {
+            font-size: 1.25rem;
+            font-weight: 600;
+            color: #361d49;
+            margin-top: 1.25rem;
+            margin-bottom: 0.5rem;
+        }
+        .prose h3 {
+            font-size: 1.125rem;
+            font-weight: 600;
+            color: #a859e4;
+            margin-top: 1rem;
+            margin-bottom: 0.5rem;
+        }
+        .prose p {
+            margin-bottom: 0.75rem;
+        }
+        .prose ul, .prose ol {
+            margin-left: 1.5rem;
+            margin-bottom: 0.75rem;
+        }
+        .prose ul { list-style-type: disc; }
+        .prose ol { list-style-type: decimal; }
+        .prose li {
+            margin-bottom: 0.25rem;
+        }
+        .prose code {
+            background: #f3f3f3;
+            padding: 2px 4px;
+            border-radius: 4px;
+            font-family: 'Courier New', monospace;
+            font-size: 0.875rem;
+        }
+        .prose pre {
+            background: #f8f8f8;
+            padding: 1rem;
+            border-radius: 8px;
+            overflow-x: auto;
+            margin: 1rem 0;
+            border: 1px solid #e5e5e5;
+        }
+        .prose pre code {
+            background: none;
+            padding: 0;
+        }
+        .prose blockquote {
+            border-left: 4px solid #a859e4;
+            padding-left: 1rem;
+            margin: 1rem 0;
+            font-style: italic;
+            color: #666;
+        }
+    </style>
+</head>
+"""
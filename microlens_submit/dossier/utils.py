@@ -6,10 +6,18 @@ generation package, including hardware formatting, GitHub URL parsing,
 and other helper functions.
 """
 
+import functools
+import gzip
+import logging
 import os
+import re
 import shutil
+import string
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Callable, Dict, List, Optional
 from urllib.parse import quote, urlparse
 
 try:  # Prefer stdlib importlib.resources when available (Python >= 3.9)
@@ -68,6 +76,13 @@ def format_hardware_info(hardware_info: Optional[Dict[str, Any]]) -> str:
     return "\n".join(lines)
 
 
+# HTTPS or SSH URL of a GitHub/GitLab repository: owner (or group path) and repo name
+_REPO_URL_RE = re.compile(
+    r"^(?:https?://(?:www\.)?|ssh://git@|git@)(?:github|gitlab)\.com[:/](.+?)/([^/]+?)(?:\.git)?/?$",
+    re.IGNORECASE,
+)
+
+
 def extract_github_repo_name(repo_url: str) -> str:
     """Extract owner/repo name from a GitHub URL.
 
@@ -98,58 +113,217 @@ def extract_github_repo_name(repo_url: str) -> str:
 
     Note:
         This function uses regex to parse GitHub URLs and handles common
-        variations. If the URL doesn't match expected patterns, it returns
-        the original URL unchanged.
+        variations (GitLab URLs, including subgroups, are accepted too). The
+        host must be github.com or gitlab.com; otherwise, or if the URL
+        doesn't match expected patterns, it returns the original URL
+        unchanged.
     """
-    # Extract the repository name from the URL
     if not repo_url:
         return None
 
-    # Handle different URL formats
-    if "github.com" in repo_url:
-        # Extract username/repo from GitHub URL
-        parts = repo_url.rstrip("/").split("/")
-        if len(parts) >= 2:
-            return f"{parts[-2]}/{parts[-1]}"
-    elif "gitlab.com" in repo_url:
-        # Extract username/repo from GitLab URL
-        parts = repo_url.rstrip("/").split("/")
-        if len(parts) >= 2:
-            return f"{parts[-2]}/{parts[-1]}"
+    match = _REPO_URL_RE.match(repo_url)
+    if match is None:
+        return repo_url
+    return f"{match.group(1)}/{match.group(2)}"
+
+
+def utc_timestamp() -> str:
+    """Return the current UTC time as shown in dossier footers.
+
+    Returns:
+        str: Timestamp formatted as ``YYYY-MM-DD HH:MM:SS UTC``.
+    """
+    return time.strftime("%Y-%m-%d %H:%M:%S UTC", time.gmtime())
+
 
-    return None
+_DOSSIER_ASSETS = ("rges-pit_logo.png", "github-desktop_logo.png", "tailwind.css", "tailwind-init.js")
+
+
+@functools.lru_cache(maxsize=None)
+def _packaged_asset_path(filename: str) -> Path:
+    """Locate a file shipped in ``microlens_submit/assets`` (resolved once per file)."""
+    try:
+        # Python 3.9+ or importlib_resources >= 3.1
+        return importlib_resources.files("microlens_submit").joinpath("assets", filename)
+    except AttributeError:
+        # Python 3.8 fallback
+        with importlib_resources.path("microlens_submit", "assets") as p:
+            return p / filename
+
+
+def _copy_if_changed(src: Path, dst: Path) -> None:
+    """Copy ``src`` to ``dst`` unless ``dst`` already holds the same file.
+
+    ``copy2`` preserves the modification time, so a ``dst`` with the same size
+    and mtime as ``src`` is an earlier copy and is left as it is. A ``dst``
+    that is a hard link to ``src`` (written by older versions) is replaced by
+    a copy, so editing the dossier never touches the installed package.
+    """
+    try:
+        dst_stat = os.stat(dst)
+    except FileNotFoundError:
+        pass
+    else:
+        src_stat = os.stat(src)
+        if (dst_stat.st_dev, dst_stat.st_ino) == (src_stat.st_dev, src_stat.st_ino):
+            os.unlink(dst)
+        elif dst_stat.st_mtime_ns == src_stat.st_mtime_ns and dst_stat.st_size == src_stat.st_size:
+            return
+    shutil.copy2(src, dst)
+
+
+def gzip_file(path: Path, compresslevel: int = 4) -> Path:
+    """Write a gzip-compressed copy of ``path`` next to it.
+
+    The copy is named ``<name>.gz`` (e.g. ``index.html.gz``), as expected by
+    web servers that serve precompressed files.
+
+    Args:
+        path: File to compress.
+        compresslevel: zlib compression level (1 fastest, 9 smallest).
+
+    Returns:
+        Path: Path of the compressed copy.
+    """
+    gz_path = path.with_name(path.name + ".gz")
+    with path.open("rb") as src, gzip.open(gz_path, "wb", compresslevel=compresslevel) as dst:
+        shutil.copyfileobj(src, dst)
+    return gz_path
+
+
+def ensure_dir(path: Path) -> None:
+    """Create ``path`` (and parents) unless it is already a directory.
+
+    Regenerating a dossier into an existing tree is the common case, so the
+    cheap ``isdir`` probe avoids the create call entirely.
+
+    Args:
+        path: Directory to create.
+    """
+    if not os.path.isdir(path):
+        path.mkdir(parents=True, exist_ok=True)
+
+
+# Footer line of event and solution pages; its timestamp changes on every run
+# and is ignored when comparing a page with the copy on disk.
+_FOOTER_TIMESTAMP_RE = re.compile(rb"Generated by microlens-submit v\S+ on (\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2} UTC)")
+
+
+def _without_footer_timestamp(data: bytes) -> bytes:
+    """Return ``data`` with the footer timestamp (if any) cut out."""
+    match = _FOOTER_TIMESTAMP_RE.search(data)
+    if match is None:
+        return data
+    return data[: match.start(1)] + data[match.end(1) :]
+
+
+class BackgroundWriter:
+    """Run file writes on a small thread pool while the caller keeps rendering.
+
+    Writing a page costs about as much as rendering it, and the GIL is
+    released during the write, so handing writes to threads overlaps the two.
+    At most ``2 * max_workers`` writes are pending at a time; :meth:`submit`
+    blocks until one finishes, so rendered pages do not pile up in memory
+    when writing is the slower side. Use as a context manager: leaving the
+    block waits for every write and re-raises the first error. Other failed
+    writes, and all of them if the block itself raised, are logged.
+
+    Args:
+        max_workers: Number of writer threads.
+    """
+
+    def __init__(self, max_workers: int = 4) -> None:
+        self._executor = ThreadPoolExecutor(max_workers=max_workers)
+        self._slots = threading.BoundedSemaphore(2 * max_workers)
+        self._futures: List[Future] = []
+
+    def submit(self, fn: Callable[..., Any], *args: Any) -> None:
+        """Schedule ``fn(*args)`` on the writer threads, waiting for a free slot."""
+        self._slots.acquire()
+        future = self._executor.submit(fn, *args)
+        future.add_done_callback(lambda _: self._slots.release())
+        self._futures.append(future)
+
+    def __enter__(self) -> "BackgroundWriter":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self._executor.shutdown(wait=True)
+        errors = [error for error in (future.exception() for future in self._futures) if error is not None]
+        # The first failed write is re-raised unless the block itself raised;
+        # every other failure is logged rather than dropped.
+        if exc_type is None and errors:
+            first, errors = errors[0], errors[1:]
+        else:
+            first = None
+        for error in errors:
+            logging.error("Dossier page write failed: %s", error, exc_info=error)
+        if first is not None:
+            raise first
+
+
+def write_page(path: Path, html: str, incremental: bool = False, writer: Optional[BackgroundWriter] = None) -> bool:
+    """Write a dossier page, optionally leaving an identical page on disk alone.
+
+    With ``incremental=True`` the page on disk is read back and compared with
+    the new content, ignoring the footer timestamp; when they match the write
+    is skipped. A skipped page therefore keeps the footer time of the run that
+    last wrote it, while a page edited or damaged by hand no longer matches
+    and is rewritten.
+
+    Args:
+        path: Destination HTML file.
+        html: Rendered page content.
+        incremental: If True, skip the write when the page is unchanged.
+        writer: Optional :class:`BackgroundWriter` to hand the write to
+            instead of writing before returning.
+
+    Returns:
+        bool: True if the page was written, False if it was left unchanged.
+    """
+    data = html.encode("utf-8")
+    if incremental:
+        try:
+            existing = path.read_bytes()
+        except FileNotFoundError:
+            pass
+        else:
+            if _without_footer_timestamp(existing) == _without_footer_timestamp(data):
+                return False
+    if writer is None:
+        path.write_bytes(data)
+    else:
+        writer.submit(path.write_bytes, data)
+    return True
 
 
 def copy_dossier_assets(output_dir: Path) -> None:
-    """Copy dossier logo assets into the output directory.
+    """Copy dossier static assets into the output directory.
 
-    Ensures the RGES-PIT and GitHub logos are available for dossier HTML pages,
-    including partial (event/solution) dossiers.
+    Ensures the RGES-PIT and GitHub logos, the dashboard stylesheet and the
+    Tailwind theme script are available for dossier HTML pages, including
+    partial (event/solution) dossiers.
 
     Args:
         output_dir: Dossier output directory containing the HTML files.
     """
-    output_dir.mkdir(parents=True, exist_ok=True)
     assets_dir = output_dir / "assets"
-    assets_dir.mkdir(exist_ok=True)
+    ensure_dir(assets_dir)
 
-    def _get_asset_path(filename: str) -> Path:
+    for filename in _DOSSIER_ASSETS:
         try:
-            # Python 3.9+ or importlib_resources >= 3.1
-            return importlib_resources.files("microlens_submit").joinpath("assets", filename)
-        except AttributeError:
-            # Python 3.8 fallback
-            with importlib_resources.path("microlens_submit", "assets") as p:
-                return p / filename
-
-    for filename in ("rges-pit_logo.png", "github-desktop_logo.png"):
-        try:
-            asset_path = _get_asset_path(filename)
-            shutil.copy2(asset_path, assets_dir / filename)
+            _copy_if_changed(_packaged_asset_path(filename), assets_dir / filename)
         except (FileNotFoundError, ModuleNotFoundError, AttributeError):
             continue
 
 
+# Asset references returned unchanged by resolve_dossier_asset_path()
+_PASSTHROUGH_URL_PREFIXES = ("http://", "https://", "data:")
+
+# Characters urllib.parse.quote() leaves as they are (with its default safe="/")
+_URL_SAFE_CHARS = frozenset(string.ascii_letters + string.digits + "_.-~/")
+
+
 def resolve_dossier_asset_path(
     path_value: Optional[str],
     project_root: Path,
@@ -177,25 +351,35 @@ def resolve_dossier_asset_path(
     if not path_value:
         return ""
 
-    parsed = urlparse(path_value)
-    if parsed.scheme in {"http", "https", "data"}:
+    # Common cases first: remote URLs, then plain paths (no scheme to parse)
+    if path_value.startswith(_PASSTHROUGH_URL_PREFIXES):
         return path_value
-
-    if parsed.scheme == "file":
-        source_path = Path(parsed.path)
+    if ":" in path_value:
+        parsed = urlparse(path_value)
+        if parsed.scheme in {"http", "https", "data"}:
+            return path_value
+        if parsed.scheme == "file":
+            source_path = parsed.path
+        else:
+            source_path = os.path.expanduser(path_value)
     else:
-        source_path = Path(path_value).expanduser()
+        source_path = os.path.expanduser(path_value)
 
-    if not source_path.is_absolute():
-        source_path = (project_root / source_path).resolve()
-    else:
-        source_path = source_path.resolve()
+    # Plain os.path string functions rather than Path objects: this runs for
+    # every plot, posterior and data file. join() keeps absolute paths as they are.
+    source_path = os.path.realpath(os.path.join(project_root, source_path))
 
-    if not source_path.exists():
+    if not os.path.exists(source_path):
         return path_value
 
     try:
-        rel_path = Path(os.path.relpath(source_path, output_dir)).as_posix()
+        rel_path = os.path.relpath(source_path, output_dir)
     except ValueError:
-        rel_path = source_path.as_posix()
+        # Different drives on Windows
+        rel_path = source_path
+    if os.sep != "/":
+        rel_path = rel_path.replace(os.sep, "/")
+    # Most relative paths need no escaping at all
+    if _URL_SAFE_CHARS.issuperset(rel_path):
+        return rel_path
     return quote(rel_path)
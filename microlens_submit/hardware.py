@@ -0,0 +1,122 @@
+"""Hardware metadata detection for submissions and solutions.
+
+Used by :meth:`Submission.autofill_nexus_info` and
+:meth:`Solution.autofill_hardware_info`. The CPU, memory and platform of the
+running machine do not change during a process, so each probe (``/proc``
+reads, :mod:`psutil` and :mod:`platform` calls) runs at most once and later
+calls reuse the result. The Nexus environment variables are cheap and are
+read on every call.
+"""
+
+import functools
+import logging
+import os
+import platform
+from typing import Any, Dict, Optional
+
+import psutil
+
+
+def _proc_field(data: bytes, key: bytes) -> Optional[bytes]:
+    """Return the stripped value of the first ``key: value`` line in ``data``.
+
+    The key is matched case-insensitively at the start of a line, as in
+    ``/proc/cpuinfo`` and ``/proc/meminfo``. Returns None if it is absent.
+    """
+    lowered = data.lower()
+    key = key.lower()
+    if lowered.startswith(key):
+        start = 0
+    else:
+        start = lowered.find(b"\n" + key)
+        if start == -1:
+            return None
+        start += 1
+    end = data.find(b"\n", start)
+    if end == -1:
+        end = len(data)
+    colon = data.find(b":", start, end)
+    if colon == -1:
+        return None
+    return data[colon + 1 : end].strip()
+
+
+@functools.lru_cache(maxsize=1)
+def _platform_info() -> Dict[str, str]:
+    return {"platform": platform.platform(), "os": platform.system()}
+
+
+@functools.lru_cache(maxsize=1)
+def _proc_info() -> Dict[str, Any]:
+    """CPU model and total memory from ``/proc``, where available."""
+    info: Dict[str, Any] = {}
+    try:
+        # The first processor block is well within the first few KB
+        with open("/proc/cpuinfo", "rb") as fh:
+            cpu_model = _proc_field(fh.read(8192), b"model name")
+        if cpu_model is not None:
+            info["cpu_details"] = cpu_model.decode("utf-8", "replace")
+    except OSError as exc:
+        logging.debug("Failed to read /proc/cpuinfo: %s", exc)
+    try:
+        # MemTotal is the first line
+        with open("/proc/meminfo", "rb") as fh:
+            mem_total = _proc_field(fh.read(4096), b"MemTotal")
+        if mem_total is not None:
+            mem_kb = int(mem_total.split()[0])
+            info["memory_gb"] = round(mem_kb / 1024**2, 2)
+    except OSError as exc:
+        logging.debug("Failed to read /proc/meminfo: %s", exc)
+    return info
+
+
+@functools.lru_cache(maxsize=1)
+def _psutil_memory_gb() -> float:
+    return round(psutil.virtual_memory().total / 1024**3, 2)
+
+
+@functools.lru_cache(maxsize=1)
+def _psutil_cpu_details() -> Optional[str]:
+    cpu = platform.processor() or platform.machine()
+    freq = psutil.cpu_freq()
+    if freq and cpu:
+        return f"{cpu} ({freq.max:.0f} MHz max)"
+    return cpu or None
+
+
+def autofill_hardware_info(hardware_info: Dict[str, Any]) -> None:
+    """Fill ``hardware_info`` in place with details of the current machine.
+
+    Existing ``platform`` and ``os`` entries are kept. The Nexus image and
+    server name, and the CPU model and memory read from ``/proc``, replace
+    existing entries. :mod:`psutil` is only consulted for ``memory_gb`` and
+    ``cpu_details`` when they are still missing.
+
+    Args:
+        hardware_info: Dictionary to update, typically
+            ``Submission.hardware_info`` or ``Solution.hardware_info``.
+    """
+    try:
+        for key, value in _platform_info().items():
+            hardware_info.setdefault(key, value)
+    except Exception as exc:
+        logging.debug("Failed to read platform info: %s", exc)
+    image = os.environ.get("JUPYTER_IMAGE_SPEC")
+    if image:
+        hardware_info["nexus_image"] = image
+    server_name = os.environ.get("JUPYTERHUB_SERVER_NAME")
+    if server_name:
+        hardware_info["server_name"] = server_name
+    hardware_info.update(_proc_info())
+    try:
+        if "memory_gb" not in hardware_info:
+            hardware_info["memory_gb"] = _psutil_memory_gb()
+    except Exception as exc:
+        logging.debug("Failed to read memory via psutil: %s", exc)
+    try:
+        if "cpu_details" not in hardware_info:
+            cpu_details = _psutil_cpu_details()
+            if cpu_details:
+                hardware_info["cpu_details"] = cpu_details
+    except Exception as exc:
+        logging.debug("Failed to read CPU via psutil: %s", exc)
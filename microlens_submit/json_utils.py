@@ -0,0 +1,60 @@
+"""JSON helpers with an optional fast path.
+
+``orjson`` parses and serializes noticeably faster than the standard library
+``json`` module. It is an optional dependency (``pip install
+microlens-submit[fast]``); when it is not installed these helpers fall back to
+:mod:`json`.
+
+Both paths write the same bytes for the data stored here (string keys,
+strings, numbers, lists, dicts), with non-ASCII text written as raw UTF-8.
+Two differences remain, handled as follows:
+
+* ``orjson`` rejects the ``NaN``/``Infinity`` literals that :mod:`json`
+  accepts, so :func:`loads` retries such documents with :mod:`json`.
+* ``orjson`` writes non-finite floats as ``null`` where :mod:`json` writes
+  ``NaN``/``Infinity``; :func:`write_json` is not used for such data.
+"""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+#: Exception raised for malformed JSON by :func:`loads` and :func:`read_json`.
+#: ``orjson.JSONDecodeError`` subclasses :class:`json.JSONDecodeError`.
+JSONDecodeError = json.JSONDecodeError
+
+
+def loads(data: bytes | str) -> Any:
+    """Parse a JSON document from ``bytes`` or ``str``."""
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            # NaN/Infinity are accepted by json (and were valid input before
+            # orjson was used); json also raises for truly malformed input.
+            pass
+    return json.loads(data)
+
+
+def read_json(path: Path) -> Any:
+    """Read and parse the JSON file at ``path``."""
+    return loads(Path(path).read_bytes())
+
+
+def write_json(path: Path, data: Any) -> None:
+    """Write ``data`` to ``path`` as indented JSON with sorted keys.
+
+    The layout matches ``json.dump(data, fh, indent=2, sort_keys=True,
+    ensure_ascii=False)``, in UTF-8.
+    """
+    if orjson is not None:
+        Path(path).write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS))
+    else:
+        Path(path).write_text(json.dumps(data, indent=2, sort_keys=True, ensure_ascii=False), encoding="utf-8")
@@ -262,11 +262,10 @@ class Event(BaseModel):
         # Validate each active solution
         for sol in active:
             # Use the centralized validation
-            solution_messages = sol.run_validation()
-            for msg in solution_messages:
-                # Only include critical errors (not warnings) that should prevent saving
-                if not msg.startswith("Warning:"):
-                    warnings.append(f"Solution {sol.solution_id}: {msg}")
+            # Only include critical errors (not warnings) that should prevent saving
+            warnings.extend(
+                [f"Solution {sol.solution_id}: {msg}" for msg in sol.run_validation() if not msg.startswith("Warning:")]
+            )
 
         return warnings
 
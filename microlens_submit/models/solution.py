@@ -6,17 +6,16 @@ microlensing model fit with parameters and metadata.
 """
 
 import logging
-import os
-import platform
 import subprocess
 import sys
 from datetime import datetime
 from pathlib import Path
 from typing import List, Literal, Optional
 
-import psutil
 from pydantic import BaseModel, Field, model_validator
 
+from ..hardware import autofill_hardware_info
+
 
 class Solution(BaseModel):
     """Container for an individual microlensing model fit.
@@ -292,56 +291,7 @@ class Solution(BaseModel):
         """
         if self.hardware_info is None:
             self.hardware_info = {}
-        try:
-            self.hardware_info.setdefault("platform", platform.platform())
-            self.hardware_info.setdefault("os", platform.system())
-        except Exception as exc:
-            logging.debug("Failed to read platform info: %s", exc)
-        try:
-            image = os.environ.get("JUPYTER_IMAGE_SPEC")
-            if image:
-                self.hardware_info["nexus_image"] = image
-        except Exception as exc:
-            logging.debug("Failed to read JUPYTER_IMAGE_SPEC: %s", exc)
-        try:
-            server_name = os.environ.get("JUPYTERHUB_SERVER_NAME")
-            if server_name:
-                self.hardware_info["server_name"] = server_name
-        except Exception as exc:
-            logging.debug("Failed to read JUPYTERHUB_SERVER_NAME: %s", exc)
-        try:
-            with open("/proc/cpuinfo", "r", encoding="utf-8") as fh:
-                for line in fh:
-                    if line.lower().startswith("model name"):
-                        self.hardware_info["cpu_details"] = line.split(":", 1)[1].strip()
-                        break
-        except OSError as exc:
-            logging.debug("Failed to read /proc/cpuinfo: %s", exc)
-        try:
-            with open("/proc/meminfo", "r", encoding="utf-8") as fh:
-                for line in fh:
-                    if line.startswith("MemTotal"):
-                        mem_kb = int(line.split(":", 1)[1].strip().split()[0])
-                        self.hardware_info["memory_gb"] = round(mem_kb / 1024**2, 2)
-                        break
-        except OSError as exc:
-            logging.debug("Failed to read /proc/meminfo: %s", exc)
-        try:
-            if "memory_gb" not in self.hardware_info:
-                mem_bytes = psutil.virtual_memory().total
-                self.hardware_info["memory_gb"] = round(mem_bytes / 1024**3, 2)
-        except Exception as exc:
-            logging.debug("Failed to read memory via psutil: %s", exc)
-        try:
-            if "cpu_details" not in self.hardware_info:
-                cpu = platform.processor() or platform.machine()
-                freq = psutil.cpu_freq()
-                if freq and cpu:
-                    self.hardware_info["cpu_details"] = f"{cpu} ({freq.max:.0f} MHz max)"
-                elif cpu:
-                    self.hardware_info["cpu_details"] = cpu
-        except Exception as exc:
-            logging.debug("Failed to read CPU via psutil: %s", exc)
+        autofill_hardware_info(self.hardware_info)
 
     def autofill_nexus_info(self) -> None:
         """Alias for autofill_hardware_info() for Nexus users."""
@@ -526,9 +476,10 @@ class Solution(BaseModel):
         path = Path(self.notes_path)
         if not path.is_absolute() and project_root is not None:
             path = project_root / path
-        if path.exists():
+        try:
             return path.read_text(encoding="utf-8")
-        return ""
+        except FileNotFoundError:
+            return ""
 
     def set_notes(
         self,
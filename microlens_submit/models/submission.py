@@ -6,27 +6,48 @@ container for a microlensing challenge submission project.
 """
 
 import base64
-import json
+import functools
 import logging
 import math
 import mimetypes
-import os
-import platform
 import re
 import shutil
 import zipfile
+from html import unescape as html_unescape
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 from urllib.parse import unquote
 
-import psutil
 from pydantic import BaseModel, Field
 
+from ..hardware import autofill_hardware_info
+from ..json_utils import JSONDecodeError, read_json, write_json
 from ..text_symbols import symbol
 from ..validate_parameters import count_model_parameters
 from .event import Event
 from .solution import Solution
 
+# Formats that are already compressed; deflating them again costs time for no gain
+_STORED_SUFFIXES = frozenset({".png", ".jpg", ".jpeg", ".gif", ".zip", ".gz", ".bz2", ".xz", ".npz", ".parquet"})
+
+
+@functools.lru_cache(maxsize=64)
+def _read_data_uri(path: str, mime_type: str, mtime_ns: int, size: int) -> str:
+    """Return the file at ``path`` as a base64 ``data:`` URI.
+
+    ``mtime_ns`` and ``size`` are only part of the cache key, so an edited
+    file is read again while repeated notebook renders reuse the encoding.
+    """
+    with open(path, "rb") as fh:
+        data = base64.b64encode(fh.read()).decode("ascii")
+    return f"data:{mime_type};base64,{data}"
+
+
+def _data_uri(path: Path, mime_type: str) -> str:
+    """Cached :func:`_read_data_uri` for ``path``, keyed on its current stat."""
+    stat = path.stat()
+    return _read_data_uri(str(path), mime_type, stat.st_mtime_ns, stat.st_size)
+
 
 class Submission(BaseModel):
     """Top-level object representing an on-disk submission project.
@@ -104,57 +125,7 @@ class Submission(BaseModel):
             List[str]: Human-readable warning messages. Empty list indicates
                       no warnings.
         """
-        messages = []
-
-        # Check metadata completeness (warnings only)
-        if not self.team_name:
-            messages.append("team_name is required")
-        if not self.tier:
-            messages.append("tier is required")
-        if not self.repo_url:
-            messages.append("repo_url is required (GitHub repository URL)")
-        if not self.hardware_info:
-            messages.append("Hardware info is missing")
-
-        # Validate tier and event IDs
-        if self.tier:
-            try:
-                from ..tier_validation import get_available_tiers, get_event_validation_error, validate_event_id
-
-                # Check if tier is valid first
-                available_tiers = get_available_tiers()
-                if self.tier not in available_tiers:
-                    messages.append(
-                        f"Invalid tier '{self.tier}' changed to 'None'. Available tiers: {available_tiers}."
-                    )
-                    # Automatically change to None tier
-                    self.tier = "None"
-
-                # Only validate events if tier is not "None"
-                if self.tier != "None":
-                    for event_id in self.events.keys():
-                        if not validate_event_id(event_id, self.tier):
-                            error_msg = get_event_validation_error(event_id, self.tier)
-                            if error_msg:
-                                messages.append(error_msg)
-            except ImportError:
-                # Tier validation module not available, skip validation
-                pass
-            except ValueError as e:
-                # Invalid tier (fallback for other validation errors)
-                messages.append(f"Invalid tier '{self.tier}': {e}")
-
-        # Validate all events
-        for event_id, event in self.events.items():
-            event_messages = event.run_validation()
-            for msg in event_messages:
-                messages.append(f"Event {event_id}: {msg}")
-
-        # Check for duplicate aliases across events
-        alias_messages = self._validate_alias_uniqueness()
-        messages.extend(alias_messages)
-
-        return messages
+        return self._collect_validation()[0]
 
     def run_validation(self) -> List[str]:
         """Validate the entire submission for missing or incomplete information.
@@ -181,9 +152,22 @@ class Submission(BaseModel):
             This method calls run_validation() on all events and solutions,
             providing a comprehensive validation report for the entire submission.
         """
+        return self._collect_validation()[0]
+
+    def _collect_validation(self) -> Tuple[List[str], List[str]]:
+        """Run every submission check once.
+
+        Shared by :meth:`run_validation` and :meth:`run_validation_warnings`,
+        and used directly by :meth:`save`, which needs the alias errors on
+        their own as well.
+
+        Returns:
+            Tuple[List[str], List[str]]: All validation messages (alias errors
+                included), and the alias errors alone.
+        """
         messages = []
 
-        # Check metadata completeness (strict validation for save/export)
+        # Check metadata completeness
         if not self.team_name:
             messages.append("team_name is required")
         if not self.tier:
@@ -225,74 +209,37 @@ class Submission(BaseModel):
 
         # Validate all events
         for event_id, event in self.events.items():
-            event_messages = event.run_validation()
-            for msg in event_messages:
-                messages.append(f"Event {event_id}: {msg}")
+            messages.extend([f"Event {event_id}: {msg}" for msg in event.run_validation()])
 
         # Check for duplicate aliases across events
         alias_messages = self._validate_alias_uniqueness()
         messages.extend(alias_messages)
 
-        return messages
+        return messages, alias_messages
 
     def get_event(self, event_id: str) -> Event:
         if event_id not in self.events:
             self.events[event_id] = Event(event_id=event_id, submission=self)
         return self.events[event_id]
 
+    @property
+    def sorted_events(self) -> List[Event]:
+        """Return the events ordered by event ID.
+
+        ``events`` is keyed by event ID, so this sorts the plain string keys
+        rather than calling a key function per event. The list is rebuilt on
+        each access because callers may modify ``events`` directly.
+
+        Returns:
+            List[Event]: Events in ascending ``event_id`` order.
+        """
+        events = self.events
+        return [events[event_id] for event_id in sorted(events)]
+
     def autofill_nexus_info(self) -> None:
         if self.hardware_info is None:
             self.hardware_info = {}
-        try:
-            self.hardware_info.setdefault("platform", platform.platform())
-            self.hardware_info.setdefault("os", platform.system())
-        except Exception as exc:
-            logging.debug("Failed to read platform info: %s", exc)
-        try:
-            image = os.environ.get("JUPYTER_IMAGE_SPEC")
-            if image:
-                self.hardware_info["nexus_image"] = image
-        except Exception as exc:
-            logging.debug("Failed to read JUPYTER_IMAGE_SPEC: %s", exc)
-        try:
-            server_name = os.environ.get("JUPYTERHUB_SERVER_NAME")
-            if server_name:
-                self.hardware_info["server_name"] = server_name
-        except Exception as exc:
-            logging.debug("Failed to read JUPYTERHUB_SERVER_NAME: %s", exc)
-        try:
-            with open("/proc/cpuinfo", "r", encoding="utf-8") as fh:
-                for line in fh:
-                    if line.lower().startswith("model name"):
-                        self.hardware_info["cpu_details"] = line.split(":", 1)[1].strip()
-                        break
-        except OSError as exc:
-            logging.debug("Failed to read /proc/cpuinfo: %s", exc)
-        try:
-            with open("/proc/meminfo", "r", encoding="utf-8") as fh:
-                for line in fh:
-                    if line.startswith("MemTotal"):
-                        mem_kb = int(line.split(":", 1)[1].strip().split()[0])
-                        self.hardware_info["memory_gb"] = round(mem_kb / 1024**2, 2)
-                        break
-        except OSError as exc:
-            logging.debug("Failed to read /proc/meminfo: %s", exc)
-        try:
-            if "memory_gb" not in self.hardware_info:
-                mem_bytes = psutil.virtual_memory().total
-                self.hardware_info["memory_gb"] = round(mem_bytes / 1024**3, 2)
-        except Exception as exc:
-            logging.debug("Failed to read memory via psutil: %s", exc)
-        try:
-            if "cpu_details" not in self.hardware_info:
-                cpu = platform.processor() or platform.machine()
-                freq = psutil.cpu_freq()
-                if freq and cpu:
-                    self.hardware_info["cpu_details"] = f"{cpu} ({freq.max:.0f} MHz max)"
-                elif cpu:
-                    self.hardware_info["cpu_details"] = cpu
-        except Exception as exc:
-            logging.debug("Failed to read CPU via psutil: %s", exc)
+        autofill_hardware_info(self.hardware_info)
 
     def _get_alias_lookup_path(self) -> Path:
         return Path(self.project_path) / "aliases.json"
@@ -301,9 +248,8 @@ class Submission(BaseModel):
         alias_path = self._get_alias_lookup_path()
         if alias_path.exists():
             try:
-                with alias_path.open("r", encoding="utf-8") as fh:
-                    return json.load(fh)
-            except (json.JSONDecodeError, OSError) as e:
+                return read_json(alias_path)
+            except (JSONDecodeError, OSError) as e:
                 logging.warning("Failed to load alias lookup table: %s", e)
                 return {}
         return {}
@@ -311,8 +257,7 @@ class Submission(BaseModel):
     def _save_alias_lookup(self, alias_lookup: Dict[str, str]) -> None:
         alias_path = self._get_alias_lookup_path()
         try:
-            with alias_path.open("w", encoding="utf-8") as fh:
-                json.dump(alias_lookup, fh, indent=2, sort_keys=True)
+            write_json(alias_path, alias_lookup)
         except OSError as e:
             logging.error("Failed to save alias lookup table: %s", e)
             raise
@@ -410,8 +355,8 @@ class Submission(BaseModel):
                 print(f"   {status_icon} {sol_id} - {sol_status['model_type']}{alias_info}{active_info}")
 
     def save(self, force: bool = False) -> None:
-        # Run comprehensive validation first
-        validation_errors = self.run_validation()
+        # Run comprehensive validation first (alias errors are collected in the same pass)
+        validation_errors, alias_errors = self._collect_validation()
         if validation_errors:
             print(f"{symbol('warning')}  Save completed with validation warnings:")
             for error in validation_errors:
@@ -426,7 +371,6 @@ class Submission(BaseModel):
             print(f"{symbol('check')} Submission saved successfully (ready for export)")
 
         # Check for alias conflicts (existing behavior)
-        alias_errors = self._validate_alias_uniqueness()
         if alias_errors:
             print(f"{symbol('error')} Save failed due to alias validation errors:")
             for error in alias_errors:
@@ -435,31 +379,42 @@ class Submission(BaseModel):
             print("   Use different aliases or remove aliases to resolve conflicts")
             raise ValueError("Alias validation failed:\n" + "\n".join(alias_errors))
 
-        unsaved_count = sum(1 for event in self.events.values() for sol in event.solutions.values() if not sol.saved)
         project = Path(self.project_path)
         events_dir = project / "events"
         events_dir.mkdir(parents=True, exist_ok=True)
-        for event in self.events.values():
+        # One pass over the solutions counts the unsaved ones, builds the alias
+        # lookup and moves temporary notes into place.
+        unsaved_count = 0
+        alias_lookup: Dict[str, str] = {}
+        # Notes directories already created during this save (one per event at most)
+        notes_dirs = set()
+        for event_id, event in self.events.items():
             for sol in event.solutions.values():
-                if sol.notes_path:
+                if not sol.saved:
+                    unsaved_count += 1
+                if sol.alias:
+                    alias_lookup[f"{event_id} {sol.alias}"] = sol.solution_id
+                # A temporary notes file always has a "tmp" path component, so
+                # paths without the substring are not split into parts at all.
+                if sol.notes_path and "tmp" in sol.notes_path:
                     notes_path = Path(sol.notes_path)
-                    if notes_path.is_absolute():
-                        src = notes_path
-                    else:
-                        src = project / notes_path
-                    is_temp = (not notes_path.is_absolute() and notes_path.parts and notes_path.parts[0] == "tmp") or (
-                        "tmp" in notes_path.parts and notes_path.name == f"{sol.solution_id}.md"
+                    is_absolute = notes_path.is_absolute()
+                    parts = notes_path.parts
+                    is_temp = (not is_absolute and parts and parts[0] == "tmp") or (
+                        "tmp" in parts and notes_path.name == f"{sol.solution_id}.md"
                     )
                     if is_temp:
+                        src = notes_path if is_absolute else project / notes_path
                         canonical = Path("events") / event.event_id / "solutions" / f"{sol.solution_id}.md"
                         dst = project / canonical
-                        dst.parent.mkdir(parents=True, exist_ok=True)
+                        if dst.parent not in notes_dirs:
+                            dst.parent.mkdir(parents=True, exist_ok=True)
+                            notes_dirs.add(dst.parent)
                         if src.exists():
                             shutil.move(src, dst)
                         sol.notes_path = str(canonical)
         with (project / "submission.json").open("w", encoding="utf-8") as fh:
             fh.write(self.model_dump_json(exclude={"events", "project_path"}, indent=2))
-        alias_lookup = self._build_alias_lookup()
         self._save_alias_lookup(alias_lookup)
         for event in self.events.values():
             event.submission = self
@@ -470,14 +425,9 @@ class Submission(BaseModel):
             print(f"{symbol('check')} Successfully saved {unsaved_count} new solution(s) to disk")
         else:
             print(f"{symbol('check')} Successfully saved submission to disk")
-        saved_aliases = [
-            f"{event_id} {sol.alias}"
-            for event_id, event in self.events.items()
-            for sol in event.solutions.values()
-            if sol.alias and sol.saved
-        ]
-        if saved_aliases:
-            print(f"{symbol('clipboard')} Saved aliases: {', '.join(saved_aliases)}")
+        # Every solution is saved at this point, so the saved aliases are the lookup keys
+        if alias_lookup:
+            print(f"{symbol('clipboard')} Saved aliases: {', '.join(alias_lookup)}")
 
     def export(self, output_path: str) -> None:
         # Run comprehensive validation first - export is strict
@@ -510,19 +460,20 @@ class Submission(BaseModel):
                     need_calc = [s for s in active_sols if s.relative_probability is None]
                     if need_calc:
                         can_calc = True
+                        # Parameter counts, computed once and reused for the BIC below
+                        n_params: Dict[str, int] = {}
                         for s in need_calc:
-                            if (
-                                s.log_likelihood is None
-                                or s.n_data_points is None
-                                or s.n_data_points <= 0
-                                or count_model_parameters(s.parameters) == 0
-                            ):
+                            if s.log_likelihood is None or s.n_data_points is None or s.n_data_points <= 0:
+                                can_calc = False
+                                break
+                            n_params[s.solution_id] = count_model_parameters(s.parameters)
+                            if n_params[s.solution_id] == 0:
                                 can_calc = False
                                 break
                         remaining = max(1.0 - provided_sum, 0.0)
                         if can_calc:
                             bic_vals = {
-                                s.solution_id: count_model_parameters(s.parameters) * math.log(s.n_data_points)
+                                s.solution_id: n_params[s.solution_id] * math.log(s.n_data_points)
                                 - 2 * s.log_likelihood
                                 for s in need_calc
                             }
@@ -582,17 +533,24 @@ class Submission(BaseModel):
                                     f"Error: File specified by {attr} in solution {sol.solution_id} "
                                     f"does not exist: {file_path}"
                                 )
+                            compress_type = (
+                                zipfile.ZIP_STORED
+                                if file_path.suffix.lower() in _STORED_SUFFIXES
+                                else zipfile.ZIP_DEFLATED
+                            )
                             zf.write(
                                 file_path,
                                 arcname=f"{sol_dir_arc}/{Path(path).name}",
+                                compress_type=compress_type,
                             )
 
     def notebook_display_dashboard(self, output_dir: Optional[str] = None) -> str:
         """Return dashboard HTML with local assets inlined for Jupyter display.
 
         This is a convenience helper for JupyterLab/JupyterHub, where relative
-        file URLs are often blocked. It reads the generated dossier HTML and
-        replaces local asset image paths with base64 data URIs.
+        file URLs are often blocked. It reads the generated dossier HTML,
+        replaces local asset image paths with base64 data URIs and inlines
+        the dossier stylesheet and scripts.
 
         Args:
             output_dir: Optional dossier output directory. Defaults to
@@ -703,29 +661,44 @@ class Submission(BaseModel):
         if not assets_dir.exists():
             return html
         for img_path in assets_dir.glob("*.png"):
-            data = base64.b64encode(img_path.read_bytes()).decode("utf-8")
+            data_uri = _data_uri(img_path, "image/png")
             html = html.replace(
                 f'src="assets/{img_path.name}"',
-                f'src="data:image/png;base64,{data}"',
+                f'src="{data_uri}"',
             )
             html = html.replace(
                 f'src="./assets/{img_path.name}"',
-                f'src="data:image/png;base64,{data}"',
+                f'src="{data_uri}"',
             )
             html = html.replace(
                 f"src='assets/{img_path.name}'",
-                f"src='data:image/png;base64,{data}'",
+                f"src='{data_uri}'",
             )
             html = html.replace(
                 f"src='./assets/{img_path.name}'",
-                f"src='data:image/png;base64,{data}'",
+                f"src='{data_uri}'",
             )
+        for css_path in assets_dir.glob("*.css"):
+            css = css_path.read_text(encoding="utf-8")
+            for prefix in ("assets/", "./assets/"):
+                html = html.replace(
+                    f'<link rel="stylesheet" href="{prefix}{css_path.name}">',
+                    f"<style>\n{css}</style>",
+                )
+        for js_path in assets_dir.glob("*.js"):
+            js = js_path.read_text(encoding="utf-8")
+            for prefix in ("assets/", "./assets/"):
+                for quote in ("'", '"'):
+                    html = html.replace(
+                        f"<script src={quote}{prefix}{js_path.name}{quote}></script>",
+                        f"<script>\n{js}</script>",
+                    )
         # Inline any local image references (plots, posteriors) for Jupyter display
         for match in re.finditer(r"src=['\"]([^'\"]+)['\"]", html):
             src = match.group(1)
             if src.startswith(("http://", "https://", "data:")):
                 continue
-            cleaned = unquote(src.split("?")[0].split("#")[0])
+            cleaned = unquote(html_unescape(src).split("?")[0].split("#")[0])
             src_path = Path(cleaned)
             if not src_path.is_absolute():
                 src_path = (dossier_dir / src_path).resolve()
@@ -734,8 +707,7 @@ class Submission(BaseModel):
             mime_type, _ = mimetypes.guess_type(src_path.name)
             if not mime_type or not mime_type.startswith("image/"):
                 continue
-            data = base64.b64encode(src_path.read_bytes()).decode("utf-8")
-            html = html.replace(src, f"data:{mime_type};base64,{data}")
+            html = html.replace(src, _data_uri(src_path, mime_type))
         return html
 
     def remove_event(self, event_id: str, force: bool = False) -> bool:
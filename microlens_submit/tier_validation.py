@@ -81,6 +81,9 @@ TIER_DEFINITIONS = {
 # Cache for event lists to avoid repeated list creation
 _EVENT_LIST_CACHE: Dict[str, Set[str]] = {}
 
+# Cache for the sorted "Valid events" listing quoted in validation errors
+_VALID_EVENTS_TEXT_CACHE: Dict[str, str] = {}
+
 
 def get_tier_event_list(tier: str) -> Set[str]:
     """Get the set of valid event IDs for a given tier.
@@ -168,12 +171,14 @@ def get_event_validation_error(event_id: str, tier: str) -> Optional[str]:
     if tier == "None" or tier not in TIER_DEFINITIONS:
         return None
 
-    valid_events = get_tier_event_list(tier)
+    # Sorting and formatting thousands of IDs is the expensive part; do it once per tier
+    if tier not in _VALID_EVENTS_TEXT_CACHE:
+        _VALID_EVENTS_TEXT_CACHE[tier] = str(sorted(get_tier_event_list(tier)))
     tier_desc = TIER_DEFINITIONS[tier]["description"]
 
     return (
         f"Event '{event_id}' is not valid for tier '{tier}' ({tier_desc}). "
-        f"Valid events for this tier: {sorted(valid_events)}"
+        f"Valid events for this tier: {_VALID_EVENTS_TEXT_CACHE[tier]}"
     )
 
 
@@ -23,6 +23,7 @@ if __name__ == "__main__":
             'importlib_resources>=1.0.0; python_version<"3.9"',
         ],
         extras_require={
+            "fast": ["orjson>=3.8"],
             "dev": [
                 "pytest",
                 "pytest-cov",
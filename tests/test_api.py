@@ -47,6 +47,7 @@ Note:
 """
 
 import json
+import math
 import subprocess
 import sys
 import tempfile
@@ -251,6 +252,9 @@ def test_export_includes_external_files(tmp_path):
         assert data["posterior_path"] == f"{base}/post.h5"
         assert data["lightcurve_plot_path"] == f"{base}/lc.png"
         assert data["lens_plane_plot_path"] == f"{base}/lens.png"
+        # Images are stored as-is, other files are deflated
+        assert zf.getinfo(f"{base}/lc.png").compress_type == zipfile.ZIP_STORED
+        assert zf.getinfo(f"{base}/post.h5").compress_type == zipfile.ZIP_DEFLATED
 
 
 def test_get_active_solutions(tmp_path):
@@ -668,6 +672,40 @@ def test_alias_lookup_table(tmp_path):
     assert alias_lookup["EVENT002 fit1"] == sol3.solution_id
 
 
+def test_json_utils_fallback_matches_stdlib(tmp_path, monkeypatch):
+    """The optional orjson fast path and the stdlib fallback write identical files."""
+    from microlens_submit import json_utils
+
+    data = {
+        "EVENT002 fit1": "b",
+        "EVENT001 fit1": "a",
+        "EVENT003 ajuste_ñ": "c",
+        "nested": {"z": [1, 2.5], "a": None},
+    }
+    expected = json.dumps(data, indent=2, sort_keys=True, ensure_ascii=False)
+
+    json_utils.write_json(tmp_path / "fast.json", data)
+    monkeypatch.setattr(json_utils, "orjson", None)
+    json_utils.write_json(tmp_path / "slow.json", data)
+
+    assert (tmp_path / "fast.json").read_text(encoding="utf-8") == expected
+    assert (tmp_path / "slow.json").read_text(encoding="utf-8") == expected
+    assert json_utils.read_json(tmp_path / "slow.json") == data
+    with pytest.raises(json_utils.JSONDecodeError):
+        json_utils.loads("{not json")
+
+
+def test_json_utils_loads_accepts_nan():
+    """NaN/Infinity literals parse with or without orjson; malformed JSON still fails."""
+    from microlens_submit import json_utils
+
+    data = json_utils.loads(b'{"u0": NaN, "tE": Infinity}')
+    assert math.isnan(data["u0"])
+    assert data["tE"] == math.inf
+    with pytest.raises(json_utils.JSONDecodeError):
+        json_utils.loads(b'{"u0": NaN,')
+
+
 def test_alias_validation_warnings(tmp_path):
     """Test that alias validation warnings are properly generated.
 
@@ -832,6 +870,46 @@ def test_cli_add_and_edit_alias(tmp_path):
     assert sol2.alias == "cli_renamed"
 
 
+def test_sorted_events_orders_by_event_id(tmp_path):
+    """sorted_events follows event IDs and reflects later additions."""
+    submission = load(str(tmp_path))
+    for event_id in ("EVENT_B", "EVENT_C", "EVENT_A"):
+        submission.get_event(event_id)
+    assert [e.event_id for e in submission.sorted_events] == ["EVENT_A", "EVENT_B", "EVENT_C"]
+
+    submission.get_event("EVENT_0")
+    assert submission.sorted_events[0].event_id == "EVENT_0"
+
+
+def test_proc_field_reads_key_value_lines():
+    """/proc fields are matched at line starts, case-insensitively."""
+    from microlens_submit.hardware import _proc_field
+
+    cpuinfo = b"processor\t: 0\nModel Name\t: Test CPU @ 2.0GHz \nflags\t: fpu\n"
+    assert _proc_field(cpuinfo, b"model name") == b"Test CPU @ 2.0GHz"
+    assert _proc_field(b"MemTotal:        8048576 kB", b"MemTotal") == b"8048576 kB"
+    assert _proc_field(cpuinfo, b"MemTotal") is None
+
+
+def test_autofill_hardware_info_probes_once(tmp_path, monkeypatch):
+    """Hardware probes are cached; environment fields are re-read each call."""
+    from microlens_submit import hardware
+
+    sub = load(str(tmp_path))
+    sub.hardware_info = {"platform": "custom"}
+    sub.autofill_nexus_info()
+    assert sub.hardware_info["platform"] == "custom"
+    assert "cpu_details" in sub.hardware_info
+
+    hits = hardware._platform_info.cache_info().hits
+    monkeypatch.setenv("JUPYTERHUB_SERVER_NAME", "server-1")
+    sol = sub.get_event("EVENT001").add_solution("1S1L", {"t0": 0.0, "u0": 0.1, "tE": 10.0})
+    sol.autofill_hardware_info()
+    assert hardware._platform_info.cache_info().hits == hits + 1
+    assert sol.hardware_info["server_name"] == "server-1"
+    assert sol.hardware_info["os"] == sub.hardware_info["os"]
+
+
 def test_remove_solution_and_event():
     """Test the remove_solution and remove_event functionality."""
     with tempfile.TemporaryDirectory() as tmpdir:
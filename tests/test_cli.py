@@ -130,6 +130,28 @@ def test_global_no_color_option():
         assert "\x1b[" not in result.stdout
 
 
+def test_no_color_applies_to_one_invocation():
+    """--no-color does not leave colour disabled for later commands in the process."""
+    from microlens_submit.cli.console import console
+
+    seen = []
+    with runner.isolated_filesystem():
+        original_print = console.print
+
+        def record(*args, **kwargs):
+            seen.append(console.no_color)
+            return original_print(*args, **kwargs)
+
+        console.print = record
+        try:
+            assert runner.invoke(app, ["--no-color", "version"]).exit_code == 0
+            assert runner.invoke(app, ["version"]).exit_code == 0
+        finally:
+            del console.print
+    assert seen == [True, False]
+    assert console.no_color is False
+
+
 def test_cli_init_and_add():
     """Test basic CLI initialization and solution addition workflow.
 
@@ -278,6 +300,46 @@ def test_cli_list_solutions():
             assert sid in result.stdout
 
 
+def test_cli_list_solutions_plain_output():
+    """Piped list-solutions output is one tab-separated line per solution."""
+    with runner.isolated_filesystem():
+        assert runner.invoke(app, ["init", "--team-name", "Team", "--tier", "test"]).exit_code == 0
+        result = runner.invoke(app, ["add-solution", "evt", "other", "--param", "a=1", "--notes", "first\nsecond"])
+        assert result.exit_code == 0
+        assert runner.invoke(app, ["add-solution", "evt", "other", "--param", "b=2"]).exit_code == 0
+        solutions = load(".").get_event("evt").solutions.values()
+        sol_a = next(s for s in solutions if "a" in s.parameters)
+        sol_b = next(s for s in solutions if "b" in s.parameters)
+        assert runner.invoke(app, ["deactivate", sol_b.solution_id]).exit_code == 0
+
+        result = runner.invoke(app, ["list-solutions", "evt"])
+        assert result.exit_code == 0
+        assert sorted(result.stdout.splitlines()) == sorted(
+            [
+                f"{sol_a.solution_id}\tother\tActive\tfirst second",
+                f"{sol_b.solution_id}\tother\tInactive\t",
+            ]
+        )
+
+
+def test_cli_list_solutions_table_on_terminal(monkeypatch):
+    """On a terminal, list-solutions renders a Rich table."""
+    from microlens_submit.cli.console import console
+
+    monkeypatch.setattr(type(console), "is_terminal", property(lambda self: True))
+    with runner.isolated_filesystem():
+        assert runner.invoke(app, ["init", "--team-name", "Team", "--tier", "test"]).exit_code == 0
+        assert runner.invoke(app, ["add-solution", "evt", "other", "--param", "a=1"]).exit_code == 0
+        sol = next(iter(load(".").get_event("evt").solutions.values()))
+
+        result = runner.invoke(app, ["list-solutions", "evt"])
+        assert result.exit_code == 0
+        assert "Solutions for evt" in result.stdout
+        assert "Model Type" in result.stdout
+        assert sol.solution_id[:8] in result.stdout
+        assert "\t" not in result.stdout
+
+
 def test_cli_compare_solutions():
     """Test CLI solution comparison functionality.
 
@@ -399,6 +461,36 @@ def test_cli_compare_solutions_skips_zero_data_points():
         assert len(header_lines) == 1
 
 
+def test_cli_compare_solutions_top():
+    """--top limits the table to the lowest-BIC solutions."""
+    with runner.isolated_filesystem():
+        assert runner.invoke(app, ["init", "--team-name", "Team", "--tier", "test"]).exit_code == 0
+        for param, ll in (("x=1", "-5"), ("y=2", "-50")):
+            result = runner.invoke(
+                app,
+                ["add-solution", "evt", "other", "--param", param, "--log-likelihood", ll, "--n-data-points", "50"],
+            )
+            assert result.exit_code == 0
+
+        result = runner.invoke(app, ["compare-solutions", "evt", "--top", "1"])
+        assert result.exit_code == 0
+        assert "-5.00" in result.stdout
+        assert "-50.00" not in result.stdout
+
+
+def test_cli_compare_solutions_without_comparable_solutions():
+    """compare-solutions reports when no solution has likelihood data instead of printing an empty table."""
+    with runner.isolated_filesystem():
+        assert runner.invoke(app, ["init", "--team-name", "Team", "--tier", "test"]).exit_code == 0
+        result = runner.invoke(app, ["add-solution", "evt", "other", "--param", "x=1"])
+        assert result.exit_code == 0
+
+        result = runner.invoke(app, ["compare-solutions", "evt"])
+        assert result.exit_code == 0
+        assert "No active solutions" in result.stdout
+        assert "Relative" not in result.stdout
+
+
 def test_params_file_option_and_bands():
     with runner.isolated_filesystem():
         assert runner.invoke(app, ["init", "--team-name", "Team", "--tier", "test"]).exit_code == 0
@@ -1083,6 +1175,22 @@ def test_cli_generate_dossier():
         assert f"microlens-submit v{__version__}" in html
 
 
+def test_cli_generate_dossier_compress():
+    """Test generate-dossier --compress writes a .gz matching the final index.html."""
+    import gzip
+
+    with runner.isolated_filesystem():
+        result = runner.invoke(app, ["init", "--team-name", "GzipTesters", "--tier", "beginner"])
+        assert result.exit_code == 0
+        result = runner.invoke(app, ["add-solution", "evt", "1S1L", "--param", "t0=555.5", "--param", "u0=0.1"])
+        assert result.exit_code == 0
+        result = runner.invoke(app, ["generate-dossier", "--compress"])
+        assert result.exit_code == 0
+        index = Path("dossier/index.html").read_bytes()
+        assert b"full_dossier_report.html" in index
+        assert gzip.decompress(Path("dossier/index.html.gz").read_bytes()) == index
+
+
 def test_cli_generate_dossier_selective_event():
     """Test generate-dossier --event-id flag generates only specific event page."""
     with runner.isolated_filesystem():
@@ -1336,6 +1444,29 @@ def test_cli_generate_dossier_full_generation():
                 assert (dossier_dir / f"{solution_id}.html").exists()
 
 
+def test_cli_generate_dossier_workers():
+    """Test generate-dossier --workers writes the same pages from worker processes."""
+    with runner.isolated_filesystem():
+        result = runner.invoke(app, ["init", "--team-name", "ParallelTesters", "--tier", "beginner"])
+        assert result.exit_code == 0
+        for event_id in ("EVENT001", "EVENT002", "EVENT003"):
+            result = runner.invoke(
+                app,
+                ["add-solution", event_id, "1S1L", "--param", "t0=555.5", "--param", "u0=0.1", "--param", "tE=25.0"],
+            )
+            assert result.exit_code == 0
+
+        result = runner.invoke(app, ["generate-dossier", "--workers", "2"])
+        assert result.exit_code == 0
+
+        dossier_dir = Path("dossier")
+        submission = load(".")
+        for event in submission.events.values():
+            assert (dossier_dir / f"{event.event_id}.html").exists()
+            for solution_id in event.solutions:
+                assert (dossier_dir / f"{solution_id}.html").exists()
+
+
 def test_cli_generate_dossier_priority_flags():
     """Test that --solution-id takes priority over --event-id when both are provided."""
     with runner.isolated_filesystem():
@@ -1,11 +1,21 @@
 """Tests for dossier page generation utilities."""
 
+import gzip
+import time
 from pathlib import Path
 
 import pytest
 
-from microlens_submit.dossier import generate_event_page
+from microlens_submit.dossier import generate_dashboard_html, generate_event_page
 from microlens_submit.dossier.dashboard import _generate_dashboard_content
+from microlens_submit.dossier.event_page import _generate_event_page_content
+from microlens_submit.dossier.solution_page import _format_uncertainty, _generate_solution_page_content
+from microlens_submit.dossier.utils import (
+    BackgroundWriter,
+    copy_dossier_assets,
+    extract_github_repo_name,
+    resolve_dossier_asset_path,
+)
 from microlens_submit.utils import load
 
 
@@ -29,6 +39,67 @@ def test_generate_dashboard_content_contains_event(tmp_path):
     assert "UnitTesters" in html
 
 
+def test_generate_dashboard_content_escapes_user_text(tmp_path):
+    """Team name and hardware info are HTML-escaped in the dashboard."""
+    sub, _ = _basic_submission(tmp_path)
+    sub.team_name = "<script>alert(1)</script>"
+    sub.hardware_info = {"cpu": "A & B"}
+    html = _generate_dashboard_content(sub)
+    assert "<script>alert(1)</script>" not in html
+    assert "&lt;script&gt;alert(1)&lt;/script&gt;" in html
+    assert "cpu: A &amp; B" in html
+
+
+def test_generate_dashboard_html_compress(tmp_path):
+    """compress=True writes a gzip copy of index.html alongside it."""
+    sub, _ = _basic_submission(tmp_path)
+    out_dir = tmp_path / "dossier"
+    generate_dashboard_html(sub, out_dir, compress=True)
+    index = (out_dir / "index.html").read_bytes()
+    assert gzip.decompress((out_dir / "index.html.gz").read_bytes()) == index
+
+
+def test_generate_dashboard_html_refreshes_footers(tmp_path):
+    """A second generation rewrites every page with the new footer time."""
+    sub, evt = _basic_submission(tmp_path)
+    sol = next(iter(evt.solutions.values()))
+    out_dir = tmp_path / "dossier"
+    generate_dashboard_html(sub, out_dir, generated_at="2026-01-01 00:00:00 UTC")
+    generate_dashboard_html(sub, out_dir, generated_at="2026-01-02 00:00:00 UTC")
+    for name in ("index.html", f"{evt.event_id}.html", f"{sol.solution_id}.html"):
+        content = (out_dir / name).read_text(encoding="utf-8")
+        assert "2026-01-02 00:00:00 UTC" in content
+        assert "2026-01-01 00:00:00 UTC" not in content
+    assert not (out_dir / ".page-digests").exists()
+
+
+def test_generate_dashboard_html_incremental(tmp_path):
+    """incremental=True skips unchanged pages but repairs edited ones."""
+    sub, evt = _basic_submission(tmp_path)
+    sol = next(iter(evt.solutions.values()))
+    out_dir = tmp_path / "dossier"
+    generate_dashboard_html(sub, out_dir, generated_at="2026-01-01 00:00:00 UTC")
+    event_page = out_dir / f"{evt.event_id}.html"
+    event_page.write_text("stale", encoding="utf-8")
+
+    generate_dashboard_html(sub, out_dir, incremental=True, generated_at="2026-01-02 00:00:00 UTC")
+    # The unchanged solution page keeps the earlier footer time
+    assert "2026-01-01 00:00:00 UTC" in (out_dir / f"{sol.solution_id}.html").read_text(encoding="utf-8")
+    content = event_page.read_text(encoding="utf-8")
+    assert evt.event_id in content
+    assert "2026-01-02 00:00:00 UTC" in content
+
+
+def test_copy_dossier_assets_copies_package_files(tmp_path):
+    """Assets are copies, not links to the installed package data."""
+    out_dir = tmp_path / "dossier"
+    copy_dossier_assets(out_dir)
+    css = out_dir / "assets" / "tailwind.css"
+    assert css.stat().st_nlink == 1
+    copy_dossier_assets(out_dir)
+    assert css.stat().st_nlink == 1
+
+
 def test_generate_event_page_creates_file(tmp_path):
     """generate_event_page writes an HTML file for the event."""
     sub, evt = _basic_submission(tmp_path)
@@ -41,9 +112,120 @@ def test_generate_event_page_creates_file(tmp_path):
     assert evt.event_id in content
 
 
+def test_generate_event_page_escapes_user_text(tmp_path):
+    """Team name, alias and model type are HTML-escaped on the event page."""
+    sub, evt = _basic_submission(tmp_path)
+    sub.team_name = "<Team> & Co"
+    sol = next(iter(evt.solutions.values()))
+    sol.alias = "<b>best</b>"
+    out_dir = tmp_path / "dossier"
+    out_dir.mkdir()
+    generate_event_page(evt, sub, out_dir)
+    content = (out_dir / f"{evt.event_id}.html").read_text(encoding="utf-8")
+    assert "&lt;Team&gt; &amp; Co" in content
+    assert "&lt;b&gt;best&lt;/b&gt;" in content
+    assert "<Team>" not in content
+
+
+def test_dossier_pages_escape_link_targets(tmp_path):
+    """Quotes in plot, posterior, data and repository links cannot break out of attributes."""
+    sub, evt = _basic_submission(tmp_path)
+    sub.repo_url = 'https://github.com/test/team"onmouseover="x'
+    sol = next(iter(evt.solutions.values()))
+    sol.lightcurve_plot_path = "plots/it's \"lc\".png"
+    sol.lens_plane_plot_path = "plots/lens'.png"
+    sol.posterior_path = "post'.h5"
+    sol.compute_info = {"git_info": {"commit": "abc123def"}}
+
+    html = _generate_solution_page_content(sol, evt, sub)
+    assert "src='plots/it&#x27;s &quot;lc&quot;.png'" in html
+    assert "src='plots/lens&#x27;.png'" in html
+    assert "href='post&#x27;.h5'" in html
+    assert 'href="https://github.com/test/team&quot;onmouseover=&quot;x/commit/abc123def"' in html
+    assert "onmouseover=\"" not in html
+
+    event_html = _generate_event_page_content(evt, sub, event_data_link="data/raw\"'.csv")
+    assert 'href="data/raw&quot;&#x27;.csv"' in event_html
+
+
+def test_background_writer_reraises_write_errors(tmp_path):
+    """Errors from background writes surface when the writer block exits."""
+    with pytest.raises(FileNotFoundError):
+        with BackgroundWriter() as writer:
+            writer.submit((tmp_path / "missing" / "page.html").write_bytes, b"x")
+
+
+def test_background_writer_logs_write_errors_when_block_raises(tmp_path, caplog):
+    """A failed write is logged, not dropped, when the block raises its own error."""
+    with pytest.raises(RuntimeError):
+        with BackgroundWriter() as writer:
+            writer.submit((tmp_path / "missing" / "page.html").write_bytes, b"x")
+            raise RuntimeError("render failed")
+    assert "Dossier page write failed" in caplog.text
+    assert "page.html" in caplog.text
+
+
+def test_background_writer_bounds_pending_writes():
+    """submit() waits once 2 * max_workers writes are queued."""
+    finished = []
+    pending = []
+
+    def slow_write(i):
+        time.sleep(0.005)
+        finished.append(i)
+
+    with BackgroundWriter(max_workers=2) as writer:
+        for i in range(20):
+            writer.submit(slow_write, i)
+            pending.append(i + 1 - len(finished))
+    assert max(pending) <= 4
+    assert sorted(finished) == list(range(20))
+
+
+def test_resolve_dossier_asset_path(tmp_path):
+    """URLs pass through; local files become paths relative to the dossier."""
+    out_dir = tmp_path / "dossier"
+    (tmp_path / "plots").mkdir()
+    (tmp_path / "plots" / "lc.png").write_bytes(b"png")
+    url = "https://example.org/lc.png"
+    assert resolve_dossier_asset_path(url, tmp_path, out_dir, subdir="plots") == url
+    assert resolve_dossier_asset_path("plots/lc.png", tmp_path, out_dir, subdir="plots") == "../plots/lc.png"
+    file_url = (tmp_path / "plots" / "lc.png").as_uri()
+    assert resolve_dossier_asset_path(file_url, tmp_path, out_dir, subdir="plots") == "../plots/lc.png"
+    assert resolve_dossier_asset_path("plots/missing.png", tmp_path, out_dir, subdir="plots") == "plots/missing.png"
+    (tmp_path / "plots" / "lc v2.png").write_bytes(b"png")
+    assert resolve_dossier_asset_path("plots/lc v2.png", tmp_path, out_dir, subdir="plots") == "../plots/lc%20v2.png"
+
+
+def test_extract_github_repo_name():
+    """Repository URLs are shortened to owner/repo; anything else is returned as is."""
+    assert extract_github_repo_name("https://github.com/owner/repo") == "owner/repo"
+    assert extract_github_repo_name("https://github.com/owner/repo.git") == "owner/repo"
+    assert extract_github_repo_name("git@github.com:owner/repo.git") == "owner/repo"
+    assert extract_github_repo_name("https://gitlab.com/group/subgroup/repo/") == "group/subgroup/repo"
+    other = "https://example.com/github.com/owner/repo"
+    assert extract_github_repo_name(other) == other
+
+
+def test_format_uncertainty():
+    """Asymmetric, symmetric and missing uncertainties are formatted for the parameter table."""
+    assert _format_uncertainty([0.1, 0.2]) == "+0.2/-0.1"
+    assert _format_uncertainty(0.01) == "±0.01"
+    assert _format_uncertainty(None) == "N/A"
+
+
 def test_generate_event_page_missing_directory(tmp_path):
     """Missing output directory raises an error."""
     sub, evt = _basic_submission(tmp_path)
     out_dir = tmp_path / "missing"
     with pytest.raises(FileNotFoundError):
         generate_event_page(evt, sub, out_dir)
+
+
+def test_copy_dossier_assets_is_repeatable(tmp_path):
+    """Copying the logos into an existing dossier tree succeeds again."""
+    out_dir = tmp_path / "dossier"
+    copy_dossier_assets(out_dir)
+    copy_dossier_assets(out_dir)
+    for name in ("rges-pit_logo.png", "github-desktop_logo.png"):
+        assert (out_dir / "assets" / name).stat().st_size > 0
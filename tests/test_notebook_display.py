@@ -24,12 +24,16 @@ def test_notebook_display_dashboard_inlines_assets(tmp_path):
     sub, _, _ = _build_submission(tmp_path)
     html = sub.notebook_display_dashboard()
     assert "data:image/png;base64" in html
+    assert 'href="./assets/tailwind.css"' not in html
+    assert ".bg-rtd-background{" in html
 
 
 def test_notebook_display_event_inlines_assets(tmp_path):
     sub, evt, _ = _build_submission(tmp_path)
     html = sub.notebook_display_event(evt.event_id)
     assert "data:image/png;base64" in html
+    assert "assets/tailwind-init.js" not in html
+    assert "'rtd-accent': '#a859e4'" in html
 
 
 def test_notebook_display_solution_inlines_assets(tmp_path):
@@ -44,3 +48,13 @@ def test_notebook_display_full_dossier_inlines_assets(tmp_path):
     _ = sub.notebook_display_dashboard()
     html = sub.notebook_display_full_dossier()
     assert "data:image/png;base64" in html
+
+
+def test_notebook_display_reuses_encoded_assets(tmp_path):
+    from microlens_submit.models.submission import _read_data_uri
+
+    sub, _, _ = _build_submission(tmp_path)
+    first = sub.notebook_display_dashboard()
+    hits = _read_data_uri.cache_info().hits
+    assert sub.notebook_display_dashboard() == first
+    assert _read_data_uri.cache_info().hits > hits